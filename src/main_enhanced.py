@@ -159,34 +159,34 @@ def main(job_id, profile_type, output_dir, dry_run, verbose, cv_only, cover_lett
             # Get complete job data (basic + scrapped + csv_processed)
             complete_job_data = datapm_loader.get_complete_job_data(job_id)
             
-            if not complete_job_data.get('job_title_original'):
+            if not complete_job_data.job_title_original:
                 console.print(f"[red]❌ No job data found for ID: {job_id}[/red]")
                 return
             
             # Convert to JobData object for compatibility
             job_data = JobData(
                 job_id=job_id,
-                job_title_original=complete_job_data['job_title_original'],
-                job_title_short=complete_job_data['job_title_short'],
-                company=complete_job_data['company'],
-                country=complete_job_data['country'],
-                state=complete_job_data.get('state'),
-                city=complete_job_data.get('city'),
-                schedule_type=complete_job_data.get('schedule_type'),
-                experience_years=complete_job_data.get('experience_years'),
-                seniority=complete_job_data.get('seniority'),
-                skills=complete_job_data['skills'],
-                degrees=complete_job_data.get('degrees', []),
-                software=complete_job_data['software']
+                job_title_original=complete_job_data.job_title_original,
+                job_title_short=complete_job_data.job_title_short,
+                company=complete_job_data.company,
+                country=complete_job_data.country,
+                state=complete_job_data.state,
+                city=complete_job_data.city,
+                schedule_type=complete_job_data.schedule_type,
+                experience_years=complete_job_data.experience_years,
+                seniority=complete_job_data.seniority,
+                skills=complete_job_data.skills,
+                degrees=complete_job_data.degrees,
+                software=complete_job_data.software
             )
             
             # Display data completeness
-            completeness = complete_job_data['data_completeness']
+            completeness = complete_job_data.data_completeness
             completeness_color = "green" if completeness > 0.8 else "yellow" if completeness > 0.5 else "red"
             console.print(f"[{completeness_color}]📊 Data completeness: {completeness:.1%}[/{completeness_color}]")
             
             # Show data sources
-            sources = complete_job_data['data_sources']
+            sources = complete_job_data.data_sources
             console.print(f"[cyan]🔗 Data sources: Basic({sources['basic_data']}), Description({sources['description_source']}), Skills({sources['skills_source']})[/cyan]")
             
             progress.update(task3, completed=True)
@@ -263,7 +263,7 @@ def main(job_id, profile_type, output_dir, dry_run, verbose, cv_only, cover_lett
                     top_bullets=[],
                     skill_list=ReplacementBlock(placeholder="SkillList", content=[], confidence=0.5),
                     software_list=ReplacementBlock(placeholder="SoftwareList", content=[], confidence=0.5),
-                    objective_title=ReplacementBlock(placeholder="ObjectiveTitle", content=complete_job_data.get('job_title_short', ''), confidence=1.0),
+                    objective_title=ReplacementBlock(placeholder="ObjectiveTitle", content=complete_job_data.job_title_short, confidence=1.0),
                     ats_recommendations=ReplacementBlock(placeholder="ATSRecommendations", content="", confidence=0.5),
                     job_id=job_id,
                     company=job_data.company,
@@ -286,7 +286,7 @@ def main(job_id, profile_type, output_dir, dry_run, verbose, cv_only, cover_lett
                     template_path,
                     replacements, 
                     output_path,
-                    complete_job_data.get('job_title_short', job_data.job_title_original)
+                    complete_job_data.job_title_short
                 )
                 
                 console.print(f"[green]📄 CV generated: {output_file.name}[/green]")
@@ -179,10 +179,8 @@ class DatabaseProfileSelector(LoggerMixin):
                 candidate_scores[role] += content_boost
                 
                 # Boost based on success metrics
-                avg_success = role_content.success_metrics.get('fit_scores', [0])
-                if avg_success:
-                    success_boost = (sum(avg_success) / len(avg_success)) * 0.2
-                    candidate_scores[role] += success_boost
+                success_boost = role_content.average_fit_score() * 0.2
+                candidate_scores[role] += success_boost
         
         return candidate_scores
 
@@ -5,13 +5,277 @@ CVPilot - Loads job descriptions from scrapped folder and skills data from csv_p
 
 import json
 import csv
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Callable
+from collections.abc import Mapping
+from dataclasses import dataclass, field, asdict
 import re
 
+import numpy as np
+
 from .logger import LoggerMixin
 from .models import JobData
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Role keywords used for skills-based role alignment
+ROLE_KEYWORDS = {
+    'Product Manager': ['product', 'strategy', 'roadmap', 'stakeholder'],
+    'Product Analyst': ['analytics', 'metrics', 'kpi', 'dashboard'],
+    'Business Analyst': ['business', 'requirements', 'process', 'workflow'],
+    'Data Analyst': ['data', 'sql', 'python', 'tableau', 'analytics'],
+    'Project Manager': ['project', 'gantt', 'timeline', 'management']
+}
+
+# Keyword vocabulary and role -> keyword id matrix (padded with -1)
+_KEYWORD_VOCAB = list(dict.fromkeys(kw for keywords in ROLE_KEYWORDS.values() for kw in keywords))
+_KEYWORD_IDS = {kw: i for i, kw in enumerate(_KEYWORD_VOCAB)}
+_ROLE_KEYWORD_MATRIX = np.full(
+    (len(ROLE_KEYWORDS), max(len(keywords) for keywords in ROLE_KEYWORDS.values())), -1, dtype=np.int32
+)
+for _row, _keywords in enumerate(ROLE_KEYWORDS.values()):
+    _ROLE_KEYWORD_MATRIX[_row, :len(_keywords)] = [_KEYWORD_IDS[kw] for kw in _keywords]
+_ROLE_KEYWORD_COUNTS = np.array([len(keywords) for keywords in ROLE_KEYWORDS.values()], dtype=np.int32)
+
+# Fixed-layout float32 record for role alignment scores (one field per role)
+ALIGNMENT_DTYPE = np.dtype([(role.lower().replace(' ', '_'), 'f4') for role in ROLE_KEYWORDS])
+
+
+def empty_role_alignment() -> np.ndarray:
+    """Role alignment placeholder for jobs without skills data"""
+    return np.zeros(0, dtype=ALIGNMENT_DTYPE)
+
+
+def role_alignment_to_dict(alignment: np.ndarray) -> Dict[str, float]:
+    """Convert a role alignment record to a {role: score} dict"""
+    if alignment.size == 0:
+        return {}
+    return {role: float(alignment[name]) for role, name in zip(ROLE_KEYWORDS, ALIGNMENT_DTYPE.names)}
+
+
+def _top_k_indices(counts: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest counts, ties kept in original order"""
+    return np.argsort(-counts, kind='mergesort')[:k]
+
+
+def _role_scores(keyword_hits: np.ndarray, role_kw_matrix: np.ndarray, role_kw_counts: np.ndarray) -> np.ndarray:
+    """Average keyword hits per role"""
+    scores = np.zeros(role_kw_matrix.shape[0])
+    for r in range(role_kw_matrix.shape[0]):
+        total = 0
+        for j in range(role_kw_matrix.shape[1]):
+            kw = role_kw_matrix[r, j]
+            if kw >= 0:
+                total += keyword_hits[kw]
+        if role_kw_counts[r] > 0:
+            scores[r] = total / role_kw_counts[r]
+    return scores
+
+
+if NUMBA_AVAILABLE:
+    _top_k_indices = njit(cache=True)(_top_k_indices)
+    _role_scores = njit(cache=True)(_role_scores)
+
+
+def _loads_json(data: Any) -> Any:
+    """Parse JSON from bytes or a buffer"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def _load_json_file(path: Path) -> Any:
+    """Load a JSON file, memory-mapping it when larger than a page"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+            return _loads_json(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads_json(view)
+
+
+def _column_index(header_index: Dict[str, int], *names: str) -> Optional[int]:
+    """Resolve the first of the given column names present in a CSV header"""
+    for name in names:
+        if name in header_index:
+            return header_index[name]
+    return None
+
+
+def _cell(row: List[str], index: Optional[int], default: Any = None) -> Any:
+    """Read a CSV cell by column index, returning default for missing columns"""
+    if index is None or index >= len(row):
+        return default
+    return row[index]
+
+
+# Manual export fields: (output key, accepted column names, default when the column is missing, split list)
+MANUAL_EXPORT_FIELDS = [
+    ('job_title_original', ('Job title (original)', 'job_title_original'), '', False),
+    ('job_title_short', ('Job title (short)', 'job_title_short'), '', False),
+    ('company', ('Company', 'company'), '', False),
+    ('country', ('Country', 'country'), 'Unknown', False),
+    ('state', ('State', 'state'), None, False),
+    ('city', ('City', 'city'), None, False),
+    ('schedule_type', ('Schedule type', 'schedule_type'), None, False),
+    ('experience_years', ('Experience years', 'experience_years'), None, False),
+    ('seniority', ('Seniority', 'seniority'), None, False),
+    ('skills', ('Skills', 'skills'), None, True),
+    ('degrees', ('Degrees', 'degrees'), None, True),
+    ('software', ('Software', 'software'), None, True),
+]
+
+
+def _compile_row_extractor(header: Tuple[str, ...]) -> Tuple[Callable, Callable]:
+    """Generate (row_job_id, extract) functions specialized for a manual export header
+
+    Column positions are resolved once and baked into the generated code, so
+    reading a row is plain list indexing with no per-field name checks. Short
+    rows are padded with None, matching csv.DictReader's restval.
+    """
+    idx = {name: i for i, name in enumerate(header)}
+    width = len(header)
+    
+    id_parts = [f"row[{col}]" for col in (_column_index(idx, 'Job ID'), _column_index(idx, 'job_id')) if col is not None]
+    id_expr = " or ".join(id_parts) or "None"
+    
+    field_lines = []
+    for key, names, default, split_list in MANUAL_EXPORT_FIELDS:
+        col = _column_index(idx, *names)
+        if col is None:
+            expr = "[]" if split_list else repr(default)
+        elif split_list:
+            expr = f"[s.strip() for s in row[{col}].split(';')] if row[{col}] else []"
+        else:
+            expr = f"row[{col}]"
+        field_lines.append(f"        {key!r}: {expr},")
+    fields_src = "\n".join(field_lines)
+    
+    src = f"""
+def row_job_id(row):
+    if len(row) < {width}:
+        row = row + [None] * ({width} - len(row))
+    return {id_expr}
+
+def extract(row, job_id):
+    if len(row) < {width}:
+        row = row + [None] * ({width} - len(row))
+    return {{
+        'job_id': job_id,
+{fields_src}
+        'source': 'manual_export',
+    }}
+"""
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, '<manual_export_extractor>', 'exec'), namespace)
+    return namespace['row_job_id'], namespace['extract']
+
+
+class _JobMatcher:
+    """Matches company/title needles against candidate rows, lowercasing the needles once"""
+
+    def __init__(self, company: str, job_title: str):
+        self.company = company.lower()
+        self.job_title = job_title.lower()
+
+    def matches(self, row_company: str, row_title: str) -> bool:
+        """Check if the company needle is in row_company or the title needle is in row_title"""
+        return bool((self.company and self.company in (row_company or '').lower()) or
+                    (self.job_title and self.job_title in (row_title or '').lower()))
+
+
+class SkillsBreakdown(Mapping):
+    """Skill/software counts stored as parallel token and count arrays
+
+    Behaves as a read-only {token: count} mapping for backward compatibility.
+    """
+
+    __slots__ = ('tokens', 'counts')
+
+    def __init__(self, tokens: Optional[List[str]] = None, counts: Optional[np.ndarray] = None):
+        self.tokens: List[str] = tokens if tokens is not None else []
+        self.counts: np.ndarray = counts if counts is not None else np.zeros(0, dtype=np.int32)
+
+    def __getitem__(self, token: str) -> int:
+        try:
+            return int(self.counts[self.tokens.index(token)])
+        except ValueError:
+            raise KeyError(token) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tokens)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __repr__(self) -> str:
+        return f"SkillsBreakdown({self.as_dict()!r})"
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the breakdown as a plain {token: count} dict"""
+        return dict(zip(self.tokens, self.counts.tolist()))
+
+
+@dataclass(slots=True, frozen=True)
+class CompleteJobData:
+    """Complete job data combining manual export, scrapped and csv_processed sources"""
+    # Basic job data (required fields for JobData model)
+    job_id: str
+    job_title_original: str = ""
+    job_title_short: str = ""
+    company: str = ""
+    country: str = "Unknown"
+    state: Optional[str] = None
+    city: Optional[str] = None
+    schedule_type: Optional[str] = None
+    experience_years: Optional[str] = None
+    seniority: Optional[str] = None
+    skills: List[str] = field(default_factory=list)
+    degrees: List[str] = field(default_factory=list)
+    software: List[str] = field(default_factory=list)
+
+    # Enhanced data from scrapped
+    job_description_full: str = ""
+    job_description_summary: str = ""
+    role_context: str = ""
+    company_context: str = ""
+    requirements_detailed: List[str] = field(default_factory=list)
+
+    # Enhanced data from csv_processed
+    skills_summary: SkillsBreakdown = field(default_factory=SkillsBreakdown)
+    software_summary: SkillsBreakdown = field(default_factory=SkillsBreakdown)
+    skills_priority: List[str] = field(default_factory=list)
+    software_priority: List[str] = field(default_factory=list)
+    role_alignment: np.ndarray = field(default_factory=empty_role_alignment)
+
+    # Metadata
+    data_sources: Dict[str, str] = field(default_factory=dict)
+    processing_timestamp: str = ""
+    data_completeness: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the mapping form for callers that need a plain dict"""
+        data = asdict(self)
+        data['skills_summary'] = self.skills_summary.as_dict()
+        data['software_summary'] = self.software_summary.as_dict()
+        data['role_alignment'] = role_alignment_to_dict(self.role_alignment)
+        return data
+
 
 class EnhancedDataPMLoader(LoggerMixin):
     """Enhanced loader for complete DataPM integration"""
@@ -29,6 +293,13 @@ class EnhancedDataPMLoader(LoggerMixin):
         self.scrapped_path = self.datapm_path / "csv" / "src" / "scrapped"
         self.csv_processed_path = self.datapm_path / "csv" / "src" / "csv_processed"
         
+        # Generated manual export row extractors keyed by CSV header
+        self._row_extractors: Dict[Tuple[str, ...], Tuple[Callable, Callable]] = {}
+        
+        # Cached scrapped folder listing, refreshed when the folder mtime changes
+        self._scrapped_names: Optional[Dict[str, str]] = None
+        self._scrapped_mtime: Optional[float] = None
+        
         # Verify paths exist
         self._verify_paths()
         
@@ -47,7 +318,7 @@ class EnhancedDataPMLoader(LoggerMixin):
         if not self.csv_processed_path.exists():
             self.logger.warning(f"⚠️ CSV processed path not found: {self.csv_processed_path}")
 
-    def get_complete_job_data(self, job_id: str) -> Dict[str, Any]:
+    def get_complete_job_data(self, job_id: str) -> CompleteJobData:
         """
         Get complete job data including description from scrapped and skills from csv_processed
         
@@ -69,47 +340,47 @@ class EnhancedDataPMLoader(LoggerMixin):
         job_title_short = self._extract_short_job_title(basic_job_data.get('job_title_original', ''))
         
         # 5. Combine all data
-        complete_data = {
+        complete_data = CompleteJobData(
             # Basic job data (required fields for JobData model)
-            'job_id': job_id,
-            'job_title_original': basic_job_data.get('job_title_original', ''),
-            'job_title_short': basic_job_data.get('job_title_short', job_title_short),
-            'company': basic_job_data.get('company', ''),
-            'country': basic_job_data.get('country', 'Unknown'),
-            'state': basic_job_data.get('state'),
-            'city': basic_job_data.get('city'),
-            'schedule_type': basic_job_data.get('schedule_type'),
-            'experience_years': basic_job_data.get('experience_years'),
-            'seniority': basic_job_data.get('seniority'),
-            'skills': basic_job_data.get('skills', []),
-            'degrees': basic_job_data.get('degrees', []),
-            'software': basic_job_data.get('software', []),
+            job_id=job_id,
+            job_title_original=basic_job_data.get('job_title_original', ''),
+            job_title_short=basic_job_data.get('job_title_short', job_title_short),
+            company=basic_job_data.get('company', ''),
+            country=basic_job_data.get('country', 'Unknown'),
+            state=basic_job_data.get('state'),
+            city=basic_job_data.get('city'),
+            schedule_type=basic_job_data.get('schedule_type'),
+            experience_years=basic_job_data.get('experience_years'),
+            seniority=basic_job_data.get('seniority'),
+            skills=basic_job_data.get('skills', []),
+            degrees=basic_job_data.get('degrees', []),
+            software=basic_job_data.get('software', []),
             
             # Enhanced data from scrapped
-            'job_description_full': job_description.get('full_description', ''),
-            'job_description_summary': job_description.get('summary', ''),
-            'role_context': job_description.get('role_context', ''),
-            'company_context': job_description.get('company_context', ''),
-            'requirements_detailed': job_description.get('requirements', []),
+            job_description_full=job_description.get('full_description', ''),
+            job_description_summary=job_description.get('summary', ''),
+            role_context=job_description.get('role_context', ''),
+            company_context=job_description.get('company_context', ''),
+            requirements_detailed=job_description.get('requirements', []),
             
             # Enhanced data from csv_processed
-            'skills_summary': skills_summary.get('skills_breakdown', {}),
-            'software_summary': skills_summary.get('software_breakdown', {}),
-            'skills_priority': skills_summary.get('priority_skills', []),
-            'software_priority': skills_summary.get('priority_software', []),
-            'role_alignment': skills_summary.get('role_alignment', {}),
+            skills_summary=skills_summary.get('skills_breakdown') or SkillsBreakdown(),
+            software_summary=skills_summary.get('software_breakdown') or SkillsBreakdown(),
+            skills_priority=skills_summary.get('priority_skills', []),
+            software_priority=skills_summary.get('priority_software', []),
+            role_alignment=skills_summary.get('role_alignment', empty_role_alignment()),
             
             # Metadata
-            'data_sources': {
+            data_sources={
                 'basic_data': basic_job_data.get('source', 'manual_export'),
                 'description_source': job_description.get('source', 'none'),
                 'skills_source': skills_summary.get('source', 'none')
             },
-            'processing_timestamp': job_description.get('timestamp', ''),
-            'data_completeness': self._calculate_data_completeness(basic_job_data, job_description, skills_summary)
-        }
+            processing_timestamp=job_description.get('timestamp', ''),
+            data_completeness=self._calculate_data_completeness(basic_job_data, job_description, skills_summary)
+        )
         
-        self.logger.info(f"✅ Complete job data loaded - completeness: {complete_data['data_completeness']:.1%}")
+        self.logger.info(f"✅ Complete job data loaded - completeness: {complete_data.data_completeness:.1%}")
         
         return complete_data
 
@@ -125,33 +396,17 @@ class EnhancedDataPMLoader(LoggerMixin):
                 for encoding in encodings:
                     try:
                         with open(manual_export_file, 'r', encoding=encoding) as f:
-                            reader = csv.DictReader(f, delimiter=';')
+                            reader = csv.reader(f, delimiter=';')
+                            header = next(reader, None) or []
+                            
+                            row_job_id, extract = self._get_row_extractor(tuple(header))
+                            job_id_str = str(job_id).strip()
+                            
                             for row in reader:
                                 # Handle both string and integer job IDs
-                                row_job_id = row.get('Job ID') or row.get('job_id')
-                                if row_job_id and (str(row_job_id).strip() == str(job_id).strip()):
-                                    # Handle both possible column name formats
-                                    job_title_col = 'Job title (original)' if 'Job title (original)' in row else 'job_title_original'
-                                    company_col = 'Company' if 'Company' in row else 'company'
-                                    skills_col = 'Skills' if 'Skills' in row else 'skills'
-                                    software_col = 'Software' if 'Software' in row else 'software'
-                                    
-                                    return {
-                                        'job_id': job_id,
-                                        'job_title_original': row.get(job_title_col, ''),
-                                        'job_title_short': row.get('Job title (short)', row.get('job_title_short', '')),
-                                        'company': row.get(company_col, ''),
-                                        'country': row.get('Country', row.get('country', 'Unknown')),
-                                        'state': row.get('State', row.get('state', None)),
-                                        'city': row.get('City', row.get('city', None)),
-                                        'schedule_type': row.get('Schedule type', row.get('schedule_type', None)),
-                                        'experience_years': row.get('Experience years', row.get('experience_years', None)),
-                                        'seniority': row.get('Seniority', row.get('seniority', None)),
-                                        'skills': [s.strip() for s in row.get(skills_col, '').split(';')] if row.get(skills_col) else [],
-                                        'degrees': [s.strip() for s in row.get('Degrees', row.get('degrees', '')).split(';')] if row.get('Degrees', row.get('degrees', '')) else [],
-                                        'software': [s.strip() for s in row.get(software_col, '').split(';')] if row.get(software_col) else [],
-                                        'source': 'manual_export'
-                                    }
+                                value = row_job_id(row)
+                                if value and value.strip() == job_id_str:
+                                    return extract(row, job_id)
                         break  # If successful, exit the encoding loop
                     except UnicodeDecodeError:
                         continue  # Try next encoding
@@ -179,6 +434,14 @@ class EnhancedDataPMLoader(LoggerMixin):
             self.logger.error(f"❌ Error loading basic job data: {e}")
             return {}
 
+    def _get_row_extractor(self, header: Tuple[str, ...]) -> Tuple[Callable, Callable]:
+        """Get the generated row extractor for a manual export header, compiling it on first use"""
+        extractor = self._row_extractors.get(header)
+        if extractor is None:
+            extractor = _compile_row_extractor(header)
+            self._row_extractors[header] = extractor
+        return extractor
+
     def _get_job_description_from_scrapped(self, job_id: str, basic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Get full job description from scrapped folder"""
         try:
@@ -194,26 +457,31 @@ class EnhancedDataPMLoader(LoggerMixin):
                 f"{basic_data.get('company', '')}_{job_id}.json".replace(' ', '_'),
             ]
             
+            # Compare casefolded names, as Path.exists() would on the default Windows path
+            names = self._scrapped_filenames()
             for filename in possible_files:
-                file_path = self.scrapped_path / filename
-                if file_path.exists():
-                    return self._parse_job_description_file(file_path)
+                actual_name = names.get(filename.casefold())
+                if actual_name is not None:
+                    return self._parse_job_description_file(self.scrapped_path / actual_name)
             
             # If no specific file found, try to find by company or title matching
-            company = basic_data.get('company', '').lower()
-            job_title = basic_data.get('job_title_original', '').lower()
+            matcher = self._build_matcher(basic_data)
             
-            for json_file in self.scrapped_path.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Check if this file matches our job
-                    if self._matches_job_criteria(data, job_id, company, job_title):
-                        return self._parse_job_description_data(data, str(json_file))
-                        
-                except Exception as e:
-                    continue
+            # Load files on worker threads (file reads release the GIL); the first match in glob order wins
+            json_files = list(self.scrapped_path.glob("*.json"))
+            if json_files:
+                workers = min(16, (os.cpu_count() or 1) * 2, len(json_files))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(self._load_scrapped_if_match, json_file, job_id, matcher)
+                               for json_file in json_files]
+                    try:
+                        for json_file, future in zip(json_files, futures):
+                            data = future.result()
+                            if data is not None:
+                                return self._parse_job_description_data(data, str(json_file))
+                    finally:
+                        for future in futures:
+                            future.cancel()
             
             self.logger.warning(f"⚠️ No job description found in scrapped folder for ID: {job_id}")
             return {'source': 'none'}
@@ -222,11 +490,39 @@ class EnhancedDataPMLoader(LoggerMixin):
             self.logger.error(f"❌ Error loading job description from scrapped: {e}")
             return {'source': 'error', 'error': str(e)}
 
+    def _scrapped_filenames(self) -> Dict[str, str]:
+        """Map casefolded file names in the scrapped folder to their actual names, from a single directory scan"""
+        try:
+            mtime = os.stat(self.scrapped_path).st_mtime
+        except OSError:
+            return {}
+        
+        if self._scrapped_names is None or mtime != self._scrapped_mtime:
+            try:
+                with os.scandir(self.scrapped_path) as it:
+                    self._scrapped_names = {entry.name.casefold(): entry.name for entry in it if entry.is_file()}
+                self._scrapped_mtime = mtime
+            except OSError:
+                return {}
+        
+        return self._scrapped_names
+
+    def _load_scrapped_if_match(self, json_file: Path, job_id: str, matcher: _JobMatcher) -> Optional[Dict[str, Any]]:
+        """Load a scrapped JSON file and return its data if it matches the job, else None"""
+        try:
+            data = _load_json_file(json_file)
+            
+            # Check if this file matches our job
+            if self._matches_job_criteria(data, job_id, matcher):
+                return data
+        except Exception:
+            pass
+        return None
+
     def _parse_job_description_file(self, file_path: Path) -> Dict[str, Any]:
         """Parse job description from JSON file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(file_path)
             
             return self._parse_job_description_data(data, str(file_path))
             
@@ -349,34 +645,31 @@ class EnhancedDataPMLoader(LoggerMixin):
         
         # Use role context if available, otherwise first paragraph
         if role_context:
-            return role_context[:300] + "..." if len(role_context) > 300 else role_context
+            return self._summarize(role_context)
         
-        # Fallback to first paragraph
-        paragraphs = full_description.split('\n\n')
-        if paragraphs:
-            first_para = paragraphs[0].strip()
-            return first_para[:300] + "..." if len(first_para) > 300 else first_para
-        
-        return full_description[:300] + "..." if len(full_description) > 300 else full_description
+        # Fallback to first paragraph (locate the boundary without splitting the whole text)
+        end = full_description.find('\n\n')
+        first_para = full_description if end == -1 else full_description[:end]
+        return self._summarize(first_para.strip())
+
+    @staticmethod
+    def _summarize(text: str, limit: int = 300) -> str:
+        """Truncate text to a summary of at most limit characters"""
+        return text[:limit] + "..." if len(text) > limit else text
+
+    def _build_matcher(self, basic_data: Dict[str, Any]) -> _JobMatcher:
+        """Build the company/title matcher for a job once per lookup"""
+        return _JobMatcher(basic_data.get('company', '') or '', basic_data.get('job_title_original', '') or '')
 
-    def _matches_job_criteria(self, data: Dict[str, Any], job_id: str, company: str, job_title: str) -> bool:
+    def _matches_job_criteria(self, data: Dict[str, Any], job_id: str, matcher: _JobMatcher) -> bool:
         """Check if scraped data matches job criteria"""
         
         # Check job ID
         if 'job_id' in data and data['job_id'] == job_id:
             return True
         
-        # Check company name
-        if company and 'company' in data:
-            if company.lower() in data['company'].lower():
-                return True
-        
-        # Check job title
-        if job_title and 'job_title' in data:
-            if job_title.lower() in data['job_title'].lower():
-                return True
-        
-        return False
+        # Check company name and job title
+        return matcher.matches(data.get('company', ''), data.get('job_title', ''))
 
     def _get_skills_summary_from_csv_processed(self, job_id: str, basic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Get skills summary from csv_processed folder"""
@@ -404,20 +697,29 @@ class EnhancedDataPMLoader(LoggerMixin):
         try:
             # Try different encodings to handle encoding issues
             encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+            matcher = self._build_matcher(basic_data)
             
             for encoding in encodings:
                 try:
                     with open(csv_file, 'r', encoding=encoding) as f:
-                        reader = csv.DictReader(f, delimiter=';')
+                        reader = csv.reader(f, delimiter=';')
+                        header = next(reader, None) or []
+                        
+                        # Resolve column indices once
+                        idx = {name: i for i, name in enumerate(header)}
+                        job_id_col = _column_index(idx, 'job_id')
+                        company_col = _column_index(idx, 'company')
+                        title_col = _column_index(idx, 'job_title', 'job_title_original')
+                        skills_col = _column_index(idx, 'skills')
+                        software_col = _column_index(idx, 'software')
                         
                         for row in reader:
-                            # Try to match by job_id first
-                            if row.get('job_id') == job_id:
-                                return self._parse_skills_row(row, str(csv_file))
-                            
-                            # Try to match by company and title
-                            if self._row_matches_job(row, basic_data):
-                                return self._parse_skills_row(row, str(csv_file))
+                            # Try to match by job_id first, then by company and title
+                            if (_cell(row, job_id_col) == job_id or
+                                    self._row_matches_job(_cell(row, company_col, ''), _cell(row, title_col, ''), matcher)):
+                                return self._parse_skills_row(
+                                    _cell(row, skills_col), _cell(row, software_col), str(csv_file)
+                                )
                     
                     return {'source': 'none'}
                 except UnicodeDecodeError:
@@ -429,29 +731,16 @@ class EnhancedDataPMLoader(LoggerMixin):
             self.logger.error(f"❌ Error reading CSV file {csv_file}: {e}")
             return {'source': 'error', 'error': str(e)}
 
-    def _row_matches_job(self, row: Dict[str, Any], basic_data: Dict[str, Any]) -> bool:
+    def _row_matches_job(self, row_company: str, row_title: str, matcher: _JobMatcher) -> bool:
         """Check if CSV row matches job data"""
-        company = basic_data.get('company', '').lower()
-        job_title = basic_data.get('job_title_original', '').lower()
-        
-        row_company = row.get('company', '').lower()
-        row_title = row.get('job_title', row.get('job_title_original', '')).lower()
-        
-        return (company and company in row_company) or (job_title and job_title in row_title)
+        return matcher.matches(row_company, row_title)
 
-    def _parse_skills_row(self, row: Dict[str, Any], source_file: str) -> Dict[str, Any]:
+    def _parse_skills_row(self, skills_str: Optional[str], software_str: Optional[str], source_file: str) -> Dict[str, Any]:
         """Parse skills data from CSV row"""
         
         # Extract skills breakdown
-        skills_breakdown = {}
-        software_breakdown = {}
-        
-        # Parse skills columns
-        if 'skills' in row:
-            skills_breakdown = self._parse_skills_string(row['skills'])
-        
-        if 'software' in row:
-            software_breakdown = self._parse_skills_string(row['software'])
+        skills_breakdown = self._parse_skills_string(skills_str)
+        software_breakdown = self._parse_skills_string(software_str)
         
         # Extract priority skills
         priority_skills = self._extract_priority_items(skills_breakdown)
@@ -470,54 +759,43 @@ class EnhancedDataPMLoader(LoggerMixin):
             'source_file': source_file
         }
 
-    def _parse_skills_string(self, skills_str: str) -> Dict[str, int]:
+    def _parse_skills_string(self, skills_str: Optional[str]) -> SkillsBreakdown:
         """Parse skills string into breakdown with counts"""
         if not skills_str:
-            return {}
-        
-        skills = [skill.strip() for skill in skills_str.split(',')]
-        skills_count = {}
+            return SkillsBreakdown()
         
-        for skill in skills:
+        skills_count: Dict[str, int] = {}
+        for skill in skills_str.split(','):
+            skill = skill.strip()
             if skill:
                 skills_count[skill] = skills_count.get(skill, 0) + 1
         
-        return skills_count
+        tokens = list(skills_count)
+        counts = np.fromiter(skills_count.values(), dtype=np.int32, count=len(tokens))
+        return SkillsBreakdown(tokens, counts)
 
-    def _extract_priority_items(self, items_dict: Dict[str, int]) -> List[str]:
+    def _extract_priority_items(self, breakdown: SkillsBreakdown) -> List[str]:
         """Extract priority items based on frequency/importance"""
-        if not items_dict:
+        if not breakdown:
             return []
         
-        # Sort by count/importance and return top items
-        sorted_items = sorted(items_dict.items(), key=lambda x: x[1], reverse=True)
-        return [item[0] for item in sorted_items[:10]]  # Top 10
+        # Rank by count/importance and return top items
+        tokens = breakdown.tokens
+        return [tokens[i] for i in _top_k_indices(breakdown.counts, 10)]  # Top 10
 
-    def _calculate_role_alignment(self, skills: Dict[str, int], software: Dict[str, int]) -> Dict[str, float]:
+    def _calculate_role_alignment(self, skills: SkillsBreakdown, software: SkillsBreakdown) -> np.ndarray:
         """Calculate alignment with different roles based on skills"""
         
-        role_keywords = {
-            'Product Manager': ['product', 'strategy', 'roadmap', 'stakeholder'],
-            'Product Analyst': ['analytics', 'metrics', 'kpi', 'dashboard'],
-            'Business Analyst': ['business', 'requirements', 'process', 'workflow'],
-            'Data Analyst': ['data', 'sql', 'python', 'tableau', 'analytics'],
-            'Project Manager': ['project', 'gantt', 'timeline', 'management']
-        }
+        all_items_lower = [item.lower() for item in skills.tokens + software.tokens]
         
-        alignment_scores = {}
-        all_items = list(skills.keys()) + list(software.keys())
-        all_items_lower = [item.lower() for item in all_items]
-        
-        for role, keywords in role_keywords.items():
-            score = 0
-            for keyword in keywords:
-                for item in all_items_lower:
-                    if keyword in item:
-                        score += 1
-            
-            alignment_scores[role] = score / len(keywords) if keywords else 0
+        # Number of items containing each keyword, then score roles numerically
+        keyword_hits = np.array(
+            [sum(1 for item in all_items_lower if keyword in item) for keyword in _KEYWORD_VOCAB],
+            dtype=np.int64
+        )
+        scores = _role_scores(keyword_hits, _ROLE_KEYWORD_MATRIX, _ROLE_KEYWORD_COUNTS)
         
-        return alignment_scores
+        return np.array(tuple(scores), dtype=ALIGNMENT_DTYPE)
 
     def _extract_short_job_title(self, job_title_original: str) -> str:
         """Extract short job title for CV main title"""
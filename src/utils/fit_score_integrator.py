@@ -3,13 +3,65 @@ Fit Score Integrator - Include Original Template Performance
 CVPilot - Considers the fit score from when the template was originally created
 """
 
+import bisect
+import functools
+import heapq
 import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
+import mmap
+import os
 import re
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _compile_log_pattern(pattern: str) -> Any:
+    """Compile a case-insensitive log pattern, using the linear-time RE2 engine when available"""
+    if RE2_AVAILABLE:
+        return re2.compile("(?i)" + pattern)
+    return re.compile(pattern, re.IGNORECASE)
+
+# Any mention of a template file, in any letter case
+_DOCX_MENTION = re.compile(rb"\.docx", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=256)
+def _template_patterns(template_name: str) -> Tuple[Tuple[Any, ...], Any, Any]:
+    """
+    Compile the log patterns for one (lower-cased) template name
+
+    Returns:
+        Tuple of (fit score patterns in order of preference, usage_pattern, success_pattern)
+    """
+    escaped = re.escape(template_name)
+
+    # Patterns indicating template creation/usage, each capturing the fit score; the first that matches wins
+    fit_score_patterns = (
+        _compile_log_pattern(r"Final fit score: (\d+\.\d+).*?" + escaped),
+        _compile_log_pattern(r"fit_score.*?: (\d+\.\d+).*?" + escaped),
+        _compile_log_pattern(r"Template.*?: " + escaped + r".*?fit.*?: (\d+\.\d+)"),
+    )
+    usage_pattern = _compile_log_pattern(r"template.*?: " + escaped)
+    success_pattern = _compile_log_pattern(r"(?:success|completed).*?:.*?" + escaped)
+
+    return fit_score_patterns, usage_pattern, success_pattern
+
+# Fit score boost buckets: below 0.4 low (penalty), 0.4+ average, 0.6+ good, 0.8+ high
+BOOST_THRESHOLDS = (0.4, 0.6, 0.8)
+BOOST_VALUES = (-0.1, 0.0, 0.08, 0.15)
+BOOST_LEVELS = ('low', 'average', 'good', 'high')
+
 class FitScoreIntegrator:
     """Integrates original fit scores from template creation into selection process"""
 
@@ -21,6 +73,21 @@ class FitScoreIntegrator:
         self.fit_score_cache = {}
         self.template_performance = {}
 
+        # Per-template data matched in the log files, filled in as templates are looked up;
+        # cleared when any log file is added, removed or modified
+        self._logs_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._indexed_log_files: Optional[List[Tuple[Path, float]]] = None
+
+        # (position in the newest-first listing, template lines) for each readable log file
+        self._log_lines: List[Tuple[int, List[str]]] = []
+
+        # Parsed results per log file path, reused while the file's mtime is unchanged
+        self._log_parsed: Dict[str, Dict[str, Any]] = {}
+
+        # Log file listing, refreshed when the logs directory changes
+        self._log_files_cache: Optional[List[Path]] = None
+        self._logs_dir_mtime: float = 0.0
+
     def get_template_fit_score(self, template_path: Path, job_data: Dict[str, Any]) -> Optional[float]:
         """
         Get the original fit score when this template was created
@@ -42,6 +109,23 @@ class FitScoreIntegrator:
 
         return fit_score
 
+    def batch_get_fit_scores(self, template_names: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get original fit scores for many templates from a single pass over the logs
+
+        Returns:
+            Dict of template name to original fit score 0-1, or None if not found
+        """
+        fit_scores = {}
+
+        for template_name in template_names:
+            if template_name not in self.fit_score_cache:
+                # Every lookup after the first is served by the shared logs index
+                self.fit_score_cache[template_name] = self._extract_original_fit_score(template_name, {})
+            fit_scores[template_name] = self.fit_score_cache[template_name]
+
+        return fit_scores
+
     def calculate_fit_score_boost(self, template_path: Path, job_data: Dict[str, Any],
                                 current_fit_score: float) -> Tuple[float, str]:
         """
@@ -55,19 +139,10 @@ class FitScoreIntegrator:
         if original_fit is None:
             return (0.0, "No original fit data available")
 
-        # Calculate boost based on original performance
-        if original_fit >= 0.8:  # High performing template
-            boost = 0.15
-            reason = f"Originally high performer ({original_fit:.2f})"
-        elif original_fit >= 0.6:  # Good performer
-            boost = 0.08
-            reason = f"Originally good performer ({original_fit:.2f})"
-        elif original_fit >= 0.4:  # Average performer
-            boost = 0.0
-            reason = f"Originally average performer ({original_fit:.2f})"
-        else:  # Low performer
-            boost = -0.1  # Penalty
-            reason = f"Originally low performer ({original_fit:.2f})"
+        # Calculate boost based on original performance bucket
+        bucket = bisect.bisect_right(BOOST_THRESHOLDS, original_fit)
+        boost = BOOST_VALUES[bucket]
+        reason = f"Originally {BOOST_LEVELS[bucket]} performer ({original_fit:.2f})"
 
         return (boost, reason)
 
@@ -90,89 +165,190 @@ class FitScoreIntegrator:
     def _extract_original_fit_score(self, template_name: str, job_data: Dict[str, Any]) -> Optional[float]:
         """Extract the original fit score from logs when template was created"""
 
-        if not self.logs_dir.exists():
-            return None
+        fit_score, performance = self._scan_template_logs(template_name)
 
-        # Look for relevant log files
-        log_files = list(self.logs_dir.glob("*.log"))
-        log_files.extend(list(self.logs_dir.glob("*.txt")))
+        # The same pass produced usage data, keep it for get_template_success_rate
+        self.template_performance.setdefault(template_name, performance)
 
-        if not log_files:
-            return None
+        return fit_score
 
-        # Sort by modification time, newest first
-        log_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    def _analyze_template_performance(self, template_name: str):
+        """Analyze historical performance of a template"""
 
-        # Search for template creation or first usage
-        for log_file in log_files[:10]:  # Check last 10 log files
-            try:
-                with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-
-                    # Look for patterns indicating template creation/usage
-                    patterns = [
-                        rf"Final fit score: (\d+\.\d+).*?{re.escape(template_name)}",
-                        rf"fit_score.*?: (\d+\.\d+).*?{re.escape(template_name)}",
-                        rf"Template.*?: {re.escape(template_name)}.*?fit.*?: (\d+\.\d+)"
-                    ]
-
-                    for pattern in patterns:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            # Take the highest fit score found
-                            scores = [float(match) for match in matches]
-                            return max(scores) if scores else None
-
-            except Exception as e:
-                self.logger.debug(f"Error reading log file {log_file}: {e}")
-                continue
+        fit_score, performance = self._scan_template_logs(template_name)
 
-        return None
+        # The same pass produced the original fit score, keep it for get_template_fit_score
+        self.fit_score_cache.setdefault(template_name, fit_score)
 
-    def _analyze_template_performance(self, template_name: str):
-        """Analyze historical performance of a template"""
+        self.template_performance[template_name] = performance
 
-        if not self.logs_dir.exists():
-            self.template_performance[template_name] = {'success_rate': 0.0, 'total_uses': 0}
-            return
+    def _scan_template_logs(self, template_name: str) -> Tuple[Optional[float], Dict[str, Any]]:
+        """
+        Look up a template's original fit score and usage history in the logs index
 
-        success_count = 0
-        total_uses = 0
+        Returns:
+            Tuple of (original fit score or None, performance dict)
+        """
 
-        # Look through logs for template usage
-        log_files = list(self.logs_dir.glob("*.log"))
-        log_files.extend(list(self.logs_dir.glob("*.txt")))
+        # Appending to a log changes its mtime but not the directory's, so stat every file
+        log_files = self._stamp_log_files(self._get_log_files())
+        if self._logs_index is None or log_files != self._indexed_log_files:
+            self._log_lines = self._read_log_lines(log_files)
+            self._logs_index = {}
+            self._indexed_log_files = log_files
 
-        for log_file in log_files:
-            try:
-                with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
+        key = template_name.lower()
+        entry = self._logs_index.get(key)
+        if entry is None:
+            entry = self._match_template(template_name)
+            self._logs_index[key] = entry
 
-                    # Count template usages
-                    usage_pattern = rf"template.*?: {re.escape(template_name)}"
-                    usages = len(re.findall(usage_pattern, content, re.IGNORECASE))
+        # Calculate success rate
+        success_rate = entry['successes'] / max(entry['usages'], 1)
 
-                    if usages > 0:
-                        total_uses += usages
+        return entry['fit_score'], {
+            'success_rate': success_rate,
+            'total_uses': entry['usages']
+        }
+
+    def _match_template(self, template_name: str) -> Dict[str, Any]:
+        """Match one template's patterns against the log lines that mention it"""
 
-                        # Look for success indicators
-                        success_pattern = rf"success.*?:.*?{re.escape(template_name)}|completed.*?:.*?{re.escape(template_name)}"
-                        successes = len(re.findall(success_pattern, content, re.IGNORECASE))
+        name = template_name.lower()
+        fit_score_patterns, usage_pattern, success_pattern = _template_patterns(name)
 
-                        success_count += successes
+        fit_score = None
+        usages = 0
+        successes = 0
 
-            except Exception as e:
-                self.logger.debug(f"Error analyzing log file {log_file}: {e}")
+        for position, lines in self._log_lines:
+            # Patterns never span lines, so only lines containing the name can match
+            mentions = [line for line in lines if name in line]
+            if not mentions:
                 continue
 
-        # Calculate success rate
-        success_rate = success_count / max(total_uses, 1)
+            # Search for template creation or first usage in the last 10 log files
+            if fit_score is None and position < 10:
+                for pattern in fit_score_patterns:
+                    scores = [float(value) for line in mentions for value in pattern.findall(line)]
+                    if scores:
+                        # Take the highest fit score of the most preferred pattern found
+                        fit_score = max(scores)
+                        break
+
+            # Count template usages, and success indicators only in files where the template was used
+            file_usages = sum(len(usage_pattern.findall(line)) for line in mentions)
+            if file_usages > 0:
+                usages += file_usages
+                successes += sum(len(success_pattern.findall(line)) for line in mentions)
+
+        return {'fit_score': fit_score, 'usages': usages, 'successes': successes}
+
+    def _get_log_files(self) -> List[Path]:
+        """Get log files, listing the directory again only when it changes"""
+
+        try:
+            dir_mtime = self.logs_dir.stat().st_mtime
+        except OSError:
+            return []
+
+        if self._log_files_cache is None or dir_mtime != self._logs_dir_mtime:
+            # Look for relevant log files
+            try:
+                with os.scandir(self.logs_dir) as it:
+                    log_files = [Path(entry.path) for entry in it
+                                 if entry.name.endswith(('.log', '.txt')) and entry.is_file()]
+            except OSError as e:
+                self.logger.debug(f"Error listing logs directory {self.logs_dir}: {e}")
+                return []
 
-        self.template_performance[template_name] = {
-            'success_rate': success_rate,
-            'total_uses': total_uses
+            self._log_files_cache = log_files
+            self._logs_dir_mtime = dir_mtime
+
+        return self._log_files_cache
+
+    def _stamp_log_files(self, log_files: List[Path]) -> List[Tuple[Path, float]]:
+        """Pair log files with their current mtimes, sorted newest first"""
+
+        stamped = []
+        for log_file in log_files:
+            try:
+                stamped.append((log_file, log_file.stat().st_mtime))
+            except OSError as e:
+                self.logger.debug(f"Error reading log file {log_file}: {e}")
+
+        # Sort by modification time, newest first
+        stamped.sort(key=lambda x: x[1], reverse=True)
+        return stamped
+
+    def _read_log_lines(self, log_files: List[Tuple[Path, float]]) -> List[Tuple[int, List[str]]]:
+        """Collect the template lines of each log file, re-parsing only files new or modified since the last read"""
+
+        log_lines: List[Tuple[int, List[str]]] = []
+        parsed_files: Dict[str, Dict[str, Any]] = {}
+
+        for position, (log_file, mtime) in enumerate(log_files):
+            key = str(log_file)
+
+            # Only parse files that are new or modified since they were last parsed
+            parsed = self._log_parsed.get(key)
+            if parsed is None or parsed['mtime'] != mtime:
+                parsed = self._parse_log_file(log_file, mtime)
+                if parsed is None:
+                    continue
+            parsed_files[key] = parsed
+
+            if parsed['lines']:
+                log_lines.append((position, parsed['lines']))
+
+        # Keep only files still present
+        self._log_parsed = parsed_files
+
+        return log_lines
+
+    def _parse_log_file(self, log_file: Path, mtime: float) -> Optional[Dict[str, Any]]:
+        """Parse one log file, returning its template lines or None if unreadable"""
+
+        try:
+            with open(log_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    lines = []
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        lines = self._parse_log_content(content)
+        except Exception as e:
+            self.logger.debug(f"Error reading log file {log_file}: {e}")
+            return None
+
+        return {
+            'mtime': mtime,
+            'lines': lines
         }
 
+    def _parse_log_content(self, content: Any) -> List[str]:
+        """
+        Extract the lines of one log file's bytes that mention a template file
+
+        Returns:
+            Decoded, lower-cased lines containing ".docx", in file order
+        """
+
+        lines: List[str] = []
+
+        # Every pattern needs a template file name on the same line, so keep only those lines
+        line_end = -1
+        for match in _DOCX_MENTION.finditer(content):
+            if match.start() < line_end:
+                continue
+            line_start = content.rfind(b'\n', 0, match.start()) + 1
+            line_end = content.find(b'\n', match.end())
+            if line_end == -1:
+                line_end = len(content)
+            # Decode before lower-casing so non-ASCII letters fold too (undecodable bytes dropped, as before mmap)
+            lines.append(content[line_start:line_end].decode('utf-8', errors='ignore').lower())
+
+        return lines
+
     def get_performance_insights(self, template_path: Path) -> Dict[str, Any]:
         """Get performance insights for a template"""
 
@@ -216,8 +392,15 @@ class FitScoreIntegrator:
         else:
             return "Low performance - consider alternatives or improvement"
 
-    def export_performance_report(self, output_file: str = "template_performance_report.json"):
-        """Export comprehensive performance report for all templates"""
+    def export_performance_report(self, output_file: str = "template_performance_report.json",
+                                  top_n: Optional[int] = None):
+        """
+        Export comprehensive performance report for all templates
+
+        Args:
+            output_file: Path of the JSON report
+            top_n: Only rank the top N templates by success rate (all templates if None)
+        """
 
         report = {
             'generated_at': datetime.now().isoformat(),
@@ -234,11 +417,18 @@ class FitScoreIntegrator:
             }
 
         # Sort by success rate
-        sorted_templates = sorted(
-            report['performance_summary'].items(),
-            key=lambda x: x[1]['success_rate'],
-            reverse=True
-        )
+        if top_n is not None:
+            sorted_templates = heapq.nlargest(
+                top_n,
+                report['performance_summary'].items(),
+                key=lambda x: x[1]['success_rate']
+            )
+        else:
+            sorted_templates = sorted(
+                report['performance_summary'].items(),
+                key=lambda x: x[1]['success_rate'],
+                reverse=True
+            )
 
         report['ranked_templates'] = [
             {
@@ -251,8 +441,11 @@ class FitScoreIntegrator:
         ]
 
         output_path = Path(output_file)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
 
         self.logger.info(f"Performance report exported to {output_path}")
         return report
@@ -0,0 +1,55 @@
+"""
+JSON I/O - Shared readers and writers for CVPilot data files
+CVPilot - Uses orjson when available, falling back to the stdlib json module
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def parse_json(raw: Union[bytes, str]) -> Any:
+    """Parse one JSON document, with orjson when available"""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when available"""
+    return parse_json(path.read_bytes())
+
+
+def write_json(path: Path, data: Any):
+    """Write data as indented JSON (orjson when available) via a temp file, so readers never see a partial file"""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    if ORJSON_AVAILABLE:
+        tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp_path.replace(path)
+
+
+def json_line(data: Any) -> str:
+    """One JSONL record, newline included"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False) + "\n"
+
+
+def end_torn_line(path: Path) -> bool:
+    """Newline-terminate a JSONL file whose last record was cut off mid-write, so the next append starts on its own line"""
+    with open(path, 'rb+') as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) == b'\n':
+            return False
+        f.write(b'\n')
+        return True
@@ -3,6 +3,7 @@ Model Selector - Utility for selecting optimal modern LLM models
 CVPilot - Helps choose the best model based on requirements
 """
 
+import functools
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from rich.console import Console
@@ -11,7 +12,7 @@ from rich.prompt import Prompt
 
 console = Console()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelRecommendation:
     """Recommendation for a specific model"""
     provider: str
@@ -29,6 +30,13 @@ class ModelSelector:
     def __init__(self):
         self.models = self._get_available_models()
 
+        # Best model per priority, computed once
+        self._best = {
+            'quality': max(self.models.values(), key=lambda x: x.quality_score),
+            'speed': max(self.models.values(), key=lambda x: x.speed_score),
+            'cost': max(self.models.values(), key=lambda x: x.cost_score)
+        }
+
     def _get_available_models(self) -> Dict[str, ModelRecommendation]:
         """Get all available modern models with their characteristics"""
 
@@ -104,18 +112,8 @@ class ModelSelector:
             use_case: specific use case (cv_generation, creative_writing, analysis)
         """
 
-        if priority == "quality":
-            # Return highest quality model
-            return max(self.models.values(), key=lambda x: x.quality_score)
-        elif priority == "speed":
-            # Return fastest model
-            return max(self.models.values(), key=lambda x: x.speed_score)
-        elif priority == "cost":
-            # Return most cost-effective model
-            return max(self.models.values(), key=lambda x: x.cost_score)
-        else:
-            # Default to quality
-            return self.models['gpt-4o']
+        # Highest quality, fastest or most cost-effective model; default to GPT-4o
+        return self._best.get(priority, self.models['gpt-4o'])
 
     def list_available_models(self):
         """Display all available models in a table"""
@@ -202,24 +200,29 @@ def setup_environment_for_model(model: ModelRecommendation) -> str:
 
     return "\n".join(commands)
 
+@functools.lru_cache(maxsize=1)
+def _get_selector() -> ModelSelector:
+    """Shared selector for the quick setup functions"""
+    return ModelSelector()
+
 # Quick setup functions for common use cases
 def setup_best_quality():
     """Setup for maximum quality"""
-    selector = ModelSelector()
+    selector = _get_selector()
     model = selector.recommend_model("quality")
     console.print(f"[green]🎯 Best Quality Setup: {model.display_name}[/green]")
     return setup_environment_for_model(model)
 
 def setup_best_speed():
     """Setup for maximum speed"""
-    selector = ModelSelector()
+    selector = _get_selector()
     model = selector.recommend_model("speed")
     console.print(f"[green]⚡ Best Speed Setup: {model.display_name}[/green]")
     return setup_environment_for_model(model)
 
 def setup_best_cost():
     """Setup for best cost-effectiveness"""
-    selector = ModelSelector()
+    selector = _get_selector()
     model = selector.recommend_model("cost")
     console.print(f"[green]💰 Best Cost Setup: {model.display_name}[/green]")
     return setup_environment_for_model(model)
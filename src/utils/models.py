@@ -2,8 +2,12 @@
 Data models for CVPilot using Pydantic
 """
 
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+import heapq
+import re
+from typing import List, Optional, Dict, Any, Union, ClassVar
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from enum import Enum
 from datetime import datetime
 
@@ -28,6 +32,17 @@ class ScheduleType(str, Enum):
     HYBRID = "hybrid"
     UNKNOWN = "unknown"
 
+# Seniority spellings found in job data, normalized to SeniorityLevel values
+_SENIORITY_MAP: Dict[str, str] = {
+    'junior': 'junior', 'jr': 'junior',
+    'mid': 'mid', 'middle': 'mid', 'intermediate': 'mid',
+    'senior': 'senior', 'sr': 'senior',
+    'lead': 'lead',
+    'manager': 'manager', 'mgr': 'manager',
+    'director': 'director', 'dir': 'director',
+    'intern': 'intern', 'internship': 'intern',
+}
+
 class JobData(BaseModel):
     """Job description data from DataPM"""
     job_id: str
@@ -44,37 +59,24 @@ class JobData(BaseModel):
     degrees: List[str] = Field(default_factory=list)
     software: List[str] = Field(default_factory=list)
     
-    @validator('skills', 'degrees', 'software', pre=True)
+    @field_validator('skills', 'degrees', 'software', mode='before')
+    @classmethod
     def split_semicolon_fields(cls, v):
         """Split semicolon-separated fields into lists"""
         if isinstance(v, str):
-            return [item.strip() for item in v.split(';') if item.strip()]
+            return [item for item in (part.strip() for part in v.split(';')) if item]
         return v or []
     
-    @validator('seniority', pre=True)
+    @field_validator('seniority', mode='before')
+    @classmethod
     def normalize_seniority(cls, v):
         """Normalize seniority values"""
         if isinstance(v, str):
-            v_lower = v.lower().strip()
-            if v_lower in ['junior', 'jr']:
-                return 'junior'
-            elif v_lower in ['mid', 'middle', 'intermediate']:
-                return 'mid'
-            elif v_lower in ['senior', 'sr']:
-                return 'senior'
-            elif v_lower in ['lead']:
-                return 'lead'
-            elif v_lower in ['manager', 'mgr']:
-                return 'manager'
-            elif v_lower in ['director', 'dir']:
-                return 'director'
-            elif v_lower in ['intern', 'internship']:
-                return 'intern'
-            else:
-                return 'unknown'
+            return _SENIORITY_MAP.get(v.lower().strip(), 'unknown')
         return v
     
-    @validator('schedule_type', pre=True)
+    @field_validator('schedule_type', mode='before')
+    @classmethod
     def normalize_schedule_type(cls, v):
         """Normalize schedule type values"""
         if isinstance(v, str):
@@ -106,6 +108,8 @@ class ProfileType(str, Enum):
 
 class MatchResult(BaseModel):
     """Result of profile matching"""
+    model_config = ConfigDict(frozen=True)
+
     fit_score: float = Field(ge=0.0, le=1.0)
     gap_list: List[str] = Field(default_factory=list)
     matched_skills: List[str] = Field(default_factory=list)
@@ -135,7 +139,8 @@ class Replacements(BaseModel):
     position: str
     generated_at: str
     
-    @validator('top_bullets')
+    @field_validator('top_bullets')
+    @classmethod
     def validate_top_bullets(cls, v):
         """Ensure we have 3-5 top bullets"""
         if len(v) < 3 or len(v) > 5:
@@ -150,6 +155,8 @@ class ValidationError(BaseModel):
 
 class ValidationResult(BaseModel):
     """Result of content validation"""
+    model_config = ConfigDict(frozen=True)
+
     is_valid: bool
     errors: List[ValidationError] = Field(default_factory=list)
     warnings: List[ValidationError] = Field(default_factory=list)
@@ -167,8 +174,7 @@ class ProfileConfig(BaseModel):
     keywords: List[str] = Field(default_factory=list)
     template_placeholders: Dict[str, Any] = Field(default_factory=dict)  # Allow any type for placeholders
     
-    class Config:
-        extra = "allow"  # Allow additional fields
+    model_config = ConfigDict(extra="allow")  # Allow additional fields
 
 class LLMConfig(BaseModel):
     """LLM configuration with modern model support"""
@@ -179,36 +185,34 @@ class LLMConfig(BaseModel):
     api_key: str = ""
     api_keys: Optional[List[str]] = None  # For Gemini rotation
 
-    # Modern model mappings
-    @property
-    def modern_models(self) -> dict:
-        """Get modern model names for each provider"""
-        return {
-            'openai': {
-                'gpt-4o': 'gpt-4o',           # Most advanced GPT-4 model
-                'gpt-4-turbo': 'gpt-4-turbo-preview',  # Previous most advanced
-                'gpt-4': 'gpt-4'              # Standard GPT-4
-            },
-            'anthropic': {
-                'claude-3-5-sonnet': 'claude-3-5-sonnet-20241022',  # Most advanced
-                'claude-3-opus': 'claude-3-opus-20240229',          # Previous best
-                'claude-3-haiku': 'claude-3-haiku-20240307'         # Fast and efficient
-            },
-            'gemini': {
-                'gemini-2-0-flash-exp': 'gemini-2.0-flash-exp',  # Most modern and fastest
-                'gemini-1-5-pro': 'gemini-1.5-pro',      # Most capable
-                'gemini-1-5-flash': 'gemini-1.5-flash',  # Fast and efficient
-                'gemini-pro': 'gemini-pro'               # Previous generation
-            }
+    # Modern model names for each provider
+    modern_models: ClassVar[Dict[str, Dict[str, str]]] = {
+        'openai': {
+            'gpt-4o': 'gpt-4o',           # Most advanced GPT-4 model
+            'gpt-4-turbo': 'gpt-4-turbo-preview',  # Previous most advanced
+            'gpt-4': 'gpt-4'              # Standard GPT-4
+        },
+        'anthropic': {
+            'claude-3-5-sonnet': 'claude-3-5-sonnet-20241022',  # Most advanced
+            'claude-3-opus': 'claude-3-opus-20240229',          # Previous best
+            'claude-3-haiku': 'claude-3-haiku-20240307'         # Fast and efficient
+        },
+        'gemini': {
+            'gemini-2-0-flash-exp': 'gemini-2.0-flash-exp',  # Most modern and fastest
+            'gemini-1-5-pro': 'gemini-1.5-pro',      # Most capable
+            'gemini-1-5-flash': 'gemini-1.5-flash',  # Fast and efficient
+            'gemini-pro': 'gemini-pro'               # Previous generation
         }
+    }
 
     def get_model_name(self) -> str:
         """Get the actual model name for API calls"""
-        models = self.modern_models.get(self.provider, {})
-        return models.get(self.model, self.model)
+        return self.modern_models.get(self.provider, {}).get(self.model, self.model)
 
 class ProcessingResult(BaseModel):
     """Result of CV processing"""
+    model_config = ConfigDict(frozen=True)
+
     job_id: str
     output_file: str
     fit_score: float
@@ -223,6 +227,22 @@ class ProcessingResult(BaseModel):
 # USER PROFILE SYSTEM - Comprehensive User Data Management
 # ============================================================================
 
+# Interactions kept in a profile; the oldest are dropped first
+MAX_INTERACTION_HISTORY = 10_000
+
+# Profile dates are MM/YYYY (month first, year last)
+_MONTH_YEAR_PATTERN = re.compile(r'(\d{1,2})/(?:\d{1,2}/)?(\d{4})')
+
+def _month_index(date_str: str) -> Optional[int]:
+    """Months since year 0 for a MM/YYYY date, or None if it can't be parsed"""
+    match = _MONTH_YEAR_PATTERN.fullmatch(date_str.strip())
+    if not match:
+        return None
+    month, year = int(match.group(1)), int(match.group(2))
+    if not 1 <= month <= 12 or year < 1:
+        return None
+    return year * 12 + month - 1
+
 class UserContact(BaseModel):
     """User contact information"""
     name: Optional[str] = None
@@ -347,26 +367,43 @@ class UserProfile(BaseModel):
     auto_extract_from_cvs: bool = True
     feedback_collection_enabled: bool = True
 
-    def update_timestamp(self):
-        """Update the last modified timestamp"""
-        self.updated_at = datetime.now().isoformat()
+    # Skills keyed by lower-cased name, in list order
+    _skills_by_name: Dict[str, SkillProficiency] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._skills_by_name = {skill.name.lower(): skill for skill in self.skills}
 
-    def add_work_experience(self, experience: WorkExperience):
+    def update_timestamp(self, timestamp: Optional[str] = None):
+        """Update the last modified timestamp (bulk updates pass one precomputed ISO timestamp)"""
+        self.updated_at = timestamp or datetime.now().isoformat()
+
+    def add_work_experience(self, experience: WorkExperience, timestamp: Optional[str] = None):
         """Add work experience and update profile"""
         self.work_experience.append(experience)
-        self.update_timestamp()
+        self.update_timestamp(timestamp)
 
-    def add_skill(self, skill: SkillProficiency):
+    def add_skill(self, skill: SkillProficiency, timestamp: Optional[str] = None):
         """Add or update skill proficiency"""
-        # Remove existing skill with same name if exists
-        self.skills = [s for s in self.skills if s.name != skill.name]
+        key = skill.name.lower()
+        if key in self._skills_by_name:
+            # Replace existing skill with same name; updated skills move to the end
+            del self._skills_by_name[key]
+            self.skills = list(self._skills_by_name.values())
+        self._skills_by_name[key] = skill
         self.skills.append(skill)
-        self.update_timestamp()
+        self.update_timestamp(timestamp)
+
+    def get_skill(self, name: str) -> Optional[SkillProficiency]:
+        """Get skill by name (case-insensitive)"""
+        return self._skills_by_name.get(name.lower())
 
-    def add_interaction(self, interaction: InteractionHistory):
+    def add_interaction(self, interaction: InteractionHistory, timestamp: Optional[str] = None):
         """Add interaction to history"""
         self.interaction_history.append(interaction)
-        self.update_timestamp()
+        excess = len(self.interaction_history) - MAX_INTERACTION_HISTORY
+        if excess > 0:
+            del self.interaction_history[:excess]
+        self.update_timestamp(timestamp)
 
     def get_top_skills(self, limit: int = 10, category: Optional[str] = None) -> List[SkillProficiency]:
         """Get top skills by proficiency, optionally filtered by category"""
@@ -374,19 +411,26 @@ class UserProfile(BaseModel):
         if category:
             skills = [s for s in skills if s.category == category]
 
-        return sorted(skills, key=lambda s: s.proficiency_level, reverse=True)[:limit]
+        return heapq.nlargest(limit, skills, key=lambda s: s.proficiency_level)
 
     def get_recent_experience(self, years: int = 5) -> List[WorkExperience]:
         """Get recent work experience within specified years"""
-        current_year = datetime.now().year
+        current_date = datetime.now()
+        current_month = current_date.year * 12 + current_date.month - 1
+        cutoff_year = current_date.year - years
         recent_exp = []
 
         for exp in self.work_experience:
-            start_year = int(exp.start_date.split('/')[-1]) if '/' in exp.start_date else current_year
-            if current_year - start_year <= years:
-                recent_exp.append(exp)
+            # Undated entries count as starting now
+            start = _month_index(exp.start_date)
+            if start is None:
+                start = current_month
+            if start // 12 >= cutoff_year:
+                recent_exp.append((start, exp))
 
-        return sorted(recent_exp, key=lambda e: e.start_date, reverse=True)
+        # Newest first, comparing (year, month) numerically rather than the MM/YYYY string
+        recent_exp.sort(key=lambda item: item[0], reverse=True)
+        return [exp for _, exp in recent_exp]
 
     def get_industry_experience(self, industry: str) -> List[WorkExperience]:
         """Get work experience in specific industry"""
@@ -394,23 +438,17 @@ class UserProfile(BaseModel):
 
     def calculate_experience_years(self) -> float:
         """Calculate total years of professional experience"""
-        total_months = 0
         current_date = datetime.now()
+        current_month = current_date.year * 12 + current_date.month - 1
+        starts, ends = [], []
 
         for exp in self.work_experience:
-            try:
-                start_parts = exp.start_date.split('/')
-                start_date = datetime(int(start_parts[-1]), int(start_parts[0]), 1)
-
-                if exp.end_date:
-                    end_parts = exp.end_date.split('/')
-                    end_date = datetime(int(end_parts[-1]), int(end_parts[0]), 28)
-                else:
-                    end_date = current_date
-
-                months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-                total_months += max(0, months)
-            except:
+            start = _month_index(exp.start_date)
+            end = _month_index(exp.end_date) if exp.end_date else current_month
+            if start is None or end is None:
                 continue
+            starts.append(start)
+            ends.append(end)
 
-        return round(total_months / 12, 1)
+        months = (np.array(ends, dtype=np.int64) - np.array(starts, dtype=np.int64)).clip(min=0)
+        return round(int(months.sum()) / 12, 1)
@@ -3,17 +3,171 @@ Role Content Manager - Categorizes CV content by job roles
 CVPilot - Organizes summaries, skills, and bullets by role for better learning
 """
 
+import functools
 import json
+import os
 import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from types import MappingProxyType
 
+from .json_io import end_torn_line, json_line, parse_json
 from .logger import LoggerMixin
 from .models import JobData
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# List fields of RoleContent that are deduplicated on insert
+CONTENT_FIELDS = ('summaries', 'bullet_points', 'skills', 'software', 'achievements')
+
+# Cap per content field; the oldest entries are evicted first
+MAX_ITEMS_PER_FIELD = 5000
+
+# Logged add_cv_content calls folded into the JSON snapshot once the change log grows this long
+ROLE_LOG_COMPACT_AFTER = 200
+
+# Bullet pool read by EnhancedBulletAnalyzer during migration
+BULLET_POOL_PATH = "templates/bullet_pool.docx"
+
+# Related roles whose content can be reused for a role
+ROLE_RELATIONSHIPS = MappingProxyType({
+    'Product Manager': ('Product Owner', 'Product Analyst'),
+    'Product Analyst': ('Product Manager', 'Business Analyst', 'Data Analyst'),
+    'Business Analyst': ('Product Analyst', 'Data Analyst', 'Project Manager'),
+    'Data Analyst': ('Product Analyst', 'Business Analyst'),
+    'Project Manager': ('Product Manager', 'Business Analyst'),
+    'Product Owner': ('Product Manager', 'Product Analyst'),
+})
+
+# find_similar_role_content content types -> RoleContent fields
+SIMILAR_CONTENT_FIELDS = {
+    'summaries': 'summaries',
+    'bullets': 'bullet_points',
+    'skills': 'skills',
+    'software': 'software',
+}
+
+# Folder name keywords per role, in match priority order
+FOLDER_ROLE_KEYWORDS = (
+    ('Product Manager', ('product manager', 'pm')),
+    ('Product Analyst', ('product analyst', 'pa')),
+    ('Business Analyst', ('business analyst', 'ba')),
+    ('Data Analyst', ('data analyst', 'da')),
+    ('Project Manager', ('project manager', 'pjm')),
+    ('Product Owner', ('product owner', 'po')),
+)
+
+# Bullet keywords that suggest a role
+BULLET_ROLE_KEYWORDS = (
+    ('Product Manager', ('product', 'roadmap', 'strategy')),
+    ('Product Analyst', ('analysis', 'metrics', 'kpi')),
+    ('Business Analyst', ('business', 'requirements', 'process')),
+    ('Data Analyst', ('data', 'sql', 'tableau')),
+    ('Project Manager', ('project', 'timeline', 'delivery')),
+)
+
+# Role mapping and standardization (read-only so standardized names can be cached)
+ROLE_MAPPING = MappingProxyType({
+    # Standard roles
+    'product manager': 'Product Manager',
+    'product analyst': 'Product Analyst', 
+    'business analyst': 'Business Analyst',
+    'data analyst': 'Data Analyst',
+    'project manager': 'Project Manager',
+    'product owner': 'Product Owner',
+    'product operations specialist': 'Product Operations Specialist',
+    'quality assurance analyst': 'Quality Assurance Analyst',
+    'quality analyst': 'Quality Analyst',
+    
+    # Aliases and variations
+    'pm': 'Product Manager',
+    'pa': 'Product Analyst',
+    'ba': 'Business Analyst', 
+    'da': 'Data Analyst',
+    'pjm': 'Project Manager',
+    'po': 'Product Owner',
+    'qa': 'Quality Assurance Analyst',
+    'qaa': 'Quality Assurance Analyst',
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _standardize_role(role_input: str) -> str:
+    """Standardize role name using ROLE_MAPPING"""
+    role_lower = role_input.lower().strip()
+    return ROLE_MAPPING.get(role_lower, role_input.title())
+
+
+class _RoleKeywordMatcher:
+    """Finds roles whose keywords occur in a text, scanning it once with Aho-Corasick when available
+
+    Matches are role bitmasks: bit i is set when roles[i] has a keyword in the text.
+    """
+
+    def __init__(self, role_keywords):
+        self.roles = tuple(role for role, _ in role_keywords)
+        self.all_roles_mask = (1 << len(self.roles)) - 1
+        self._keyword_bits: Dict[str, int] = {}
+        for index, (_, keywords) in enumerate(role_keywords):
+            for keyword in keywords:
+                self._keyword_bits[keyword] = self._keyword_bits.get(keyword, 0) | (1 << index)
+        
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, bits in self._keyword_bits.items():
+                self._automaton.add_word(keyword, bits)
+            self._automaton.make_automaton()
+
+    def match(self, text_lower: str) -> int:
+        """Bitmask of roles with a keyword in the lower-cased text"""
+        mask = 0
+        if self._automaton is not None:
+            for _, bits in self._automaton.iter(text_lower):
+                mask |= bits
+        else:
+            for keyword, bits in self._keyword_bits.items():
+                if keyword in text_lower:
+                    mask |= bits
+        return mask
+
+    def roles_in(self, mask: int) -> Tuple[str, ...]:
+        """Role names for the bits set in mask, in table order"""
+        return tuple(role for i, role in enumerate(self.roles) if mask >> i & 1)
+
+
+_FOLDER_ROLE_MATCHER = _RoleKeywordMatcher(FOLDER_ROLE_KEYWORDS)
+_BULLET_ROLE_MATCHER = _RoleKeywordMatcher(BULLET_ROLE_KEYWORDS)
+
+
+@functools.lru_cache(maxsize=256)
+def _infer_roles(bullets: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Roles suggested by bullet keywords (cached, as bullet groups repeat across companies)"""
+    mask = 0
+    for bullet in bullets:
+        mask |= _BULLET_ROLE_MATCHER.match(bullet.lower())
+        if mask == _BULLET_ROLE_MATCHER.all_roles_mask:
+            break
+    
+    return _BULLET_ROLE_MATCHER.roles_in(mask) or ('Product Analyst',)  # Default fallback
+
 
 @dataclass
 class RoleContent:
@@ -27,6 +181,46 @@ class RoleContent:
     cv_count: int
     last_updated: str
     success_metrics: Dict[str, float]  # fit_scores, user_ratings, etc.
+    _idx: Dict[str, set] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Set indexes mirror the lists so dedup is O(1) while list order is kept for output
+        self._idx = {name: set(getattr(self, name)) for name in CONTENT_FIELDS}
+        
+        # Backfill running fit score totals for databases saved before they existed
+        fit_scores = self.success_metrics.get('fit_scores')
+        if fit_scores and 'fit_score_n' not in self.success_metrics:
+            self.success_metrics['fit_score_sum'] = float(sum(fit_scores))
+            self.success_metrics['fit_score_n'] = len(fit_scores)
+
+    def add_fit_score(self, score: float):
+        """Record a fit score and keep the running sum and count up to date"""
+        self.success_metrics.setdefault('fit_scores', []).append(score)
+        self.success_metrics['fit_score_sum'] = self.success_metrics.get('fit_score_sum', 0.0) + score
+        self.success_metrics['fit_score_n'] = self.success_metrics.get('fit_score_n', 0) + 1
+
+    def average_fit_score(self) -> float:
+        """Average recorded fit score, 0.0 when none"""
+        count = self.success_metrics.get('fit_score_n', 0)
+        return self.success_metrics.get('fit_score_sum', 0.0) / count if count else 0.0
+
+    def add_unique(self, content_field: str, items: List[str]):
+        """Append items not already present in the given content field"""
+        seen = self._idx[content_field]
+        target = getattr(self, content_field)
+        for item in items:
+            if item not in seen:
+                seen.add(item)
+                target.append(item)
+        
+        excess = len(target) - MAX_ITEMS_PER_FIELD
+        if excess > 0:
+            seen.difference_update(target[:excess])
+            del target[:excess]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form without the dedup indexes"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
 
 class RoleContentManager(LoggerMixin):
@@ -36,31 +230,25 @@ class RoleContentManager(LoggerMixin):
         super().__init__()
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True, parents=True)
-        self.content_file = self.data_dir / "role_content_database.json"
+        self.content_file = self.data_dir / "role_content_database.json"  # Snapshot, rewritten on compaction
+        self.changes_file = self.data_dir / "role_content_changes.jsonl"  # Append-only, one add_cv_content per line
+        
+        # Write-back state: add_cv_content saves immediately unless inside batch()
+        self._autosave = True
+        self._batch_timestamp: Optional[str] = None
+        
+        # Change log state: changes not yet appended, lines already in the log,
+        # and the CRC of the snapshot the log applies on top of
+        self._pending_changes: List[Dict[str, Any]] = []
+        self._logged_changes = 0
+        self._snapshot_crc = 0
+        self._log_current = False
+        
+        # Bullet analyzer is built on first bullet pool migration
+        self._bullet_analyzer = None
         
         # Role mapping and standardization
-        self.role_mapping = {
-            # Standard roles
-            'product manager': 'Product Manager',
-            'product analyst': 'Product Analyst', 
-            'business analyst': 'Business Analyst',
-            'data analyst': 'Data Analyst',
-            'project manager': 'Project Manager',
-            'product owner': 'Product Owner',
-            'product operations specialist': 'Product Operations Specialist',
-            'quality assurance analyst': 'Quality Assurance Analyst',
-            'quality analyst': 'Quality Analyst',
-            
-            # Aliases and variations
-            'pm': 'Product Manager',
-            'pa': 'Product Analyst',
-            'ba': 'Business Analyst', 
-            'da': 'Data Analyst',
-            'pjm': 'Project Manager',
-            'po': 'Product Owner',
-            'qa': 'Quality Assurance Analyst',
-            'qaa': 'Quality Assurance Analyst'
-        }
+        self.role_mapping = ROLE_MAPPING
         
         # Load existing database
         self.role_database = self._load_role_database()
@@ -68,55 +256,160 @@ class RoleContentManager(LoggerMixin):
         self.logger.info(f"✅ RoleContentManager initialized with {len(self.role_database)} roles")
 
     def _load_role_database(self) -> Dict[str, RoleContent]:
-        """Load role content database from file"""
-        if not self.content_file.exists():
-            return {}
+        """Load the role database snapshot and replay the change log on top of it"""
+        database = {}
+        raw = b''
+        if self.content_file.exists():
+            try:
+                raw = self.content_file.read_bytes()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                
+                # Convert dict to RoleContent objects
+                for role_name, content_data in data.items():
+                    database[role_name] = RoleContent(**content_data)
+            except Exception as e:
+                self.logger.error(f"❌ Error loading role database: {e}")
+                return {}
         
+        self._snapshot_crc = zlib.crc32(raw)
+        self._replay_changes(database)
+        return database
+
+    def _replay_changes(self, database: Dict[str, RoleContent]):
+        """Apply logged changes made since the snapshot was written"""
+        if not self.changes_file.exists():
+            return
+        
+        # The header names the snapshot the log was started on; a log left over from before
+        # the last compaction (or a hand-edited snapshot) is stale and is not replayed
+        skipped = 0
         try:
-            with open(self.content_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Convert dict to RoleContent objects
-            database = {}
-            for role_name, content_data in data.items():
-                database[role_name] = RoleContent(**content_data)
-            
-            return database
-        except Exception as e:
-            self.logger.error(f"❌ Error loading role database: {e}")
-            return {}
+            with open(self.changes_file, 'rb') as f:
+                header = parse_json(f.readline() or b'{}')
+                if not isinstance(header, dict) or header.get('snapshot_crc32') != self._snapshot_crc:
+                    self.logger.warning(f"⚠️ Ignoring {self.changes_file.name}, it was written for another snapshot")
+                    return
+                
+                # Decode line by line so one torn or corrupt line only loses that change
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        self._apply_change(database, parse_json(line))
+                    except (ValueError, TypeError, KeyError):
+                        skipped += 1
+                        continue
+                    self._logged_changes += 1
+            end_torn_line(self.changes_file)
+            self._log_current = True
+        except (OSError, ValueError) as e:
+            self.logger.error(f"❌ Error loading role changes: {e}")
+        
+        if skipped:
+            self.logger.warning(f"⚠️ Skipped {skipped} unreadable lines in {self.changes_file.name}")
 
     def _save_role_database(self):
-        """Save role content database to file"""
+        """Append pending changes to the change log, compacting it once it grows long"""
+        if not self._pending_changes:
+            return
+        
+        if not self._log_current or self._logged_changes + len(self._pending_changes) >= ROLE_LOG_COMPACT_AFTER:
+            self._compact_role_database()
+            return
+        
+        try:
+            with open(self.changes_file, 'a', encoding='utf-8') as f:
+                f.writelines(json_line(change) for change in self._pending_changes)
+            self._logged_changes += len(self._pending_changes)
+            self._pending_changes.clear()
+        except Exception as e:
+            self.logger.error(f"❌ Error saving role changes: {e}")
+
+    def _compact_role_database(self):
+        """Rewrite the snapshot with every change folded in and start an empty change log"""
         try:
             # Convert RoleContent objects to dict
             data = {}
             for role_name, content in self.role_database.items():
-                data[role_name] = asdict(content)
+                data[role_name] = content.to_dict()
             
-            with open(self.content_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
+            # Write to a temp file and swap it in, so readers never see a partial database
+            if ORJSON_AVAILABLE:
+                raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            tmp_file = self.content_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(raw)
+            tmp_file.replace(self.content_file)
+            
+            # A crash before the new log lands leaves the old one, whose header no longer matches
+            self._snapshot_crc = zlib.crc32(raw)
+            tmp_log = self.changes_file.with_suffix('.jsonl.tmp')
+            tmp_log.write_text(json_line({'snapshot_crc32': self._snapshot_crc}), encoding='utf-8')
+            tmp_log.replace(self.changes_file)
+            
+            self._pending_changes.clear()
+            self._logged_changes = 0
+            self._log_current = True
             self.logger.info(f"💾 Role database saved with {len(data)} roles")
         except Exception as e:
             self.logger.error(f"❌ Error saving role database: {e}")
 
+    def flush(self):
+        """Save the role database if it has unsaved changes"""
+        if self._pending_changes:
+            self._save_role_database()
+
+    @contextmanager
+    def batch(self):
+        """Defer database saves until the block exits, then save once"""
+        previous = (self._autosave, self._batch_timestamp)
+        self._autosave = False
+        # One timestamp stamps every role updated in the batch
+        self._batch_timestamp = self._batch_timestamp or datetime.now().isoformat()
+        try:
+            yield self
+        finally:
+            self._autosave, self._batch_timestamp = previous
+            self.flush()
+
     def standardize_role_name(self, role_input: str) -> str:
         """Standardize role name using mapping"""
-        role_lower = role_input.lower().strip()
-        return self.role_mapping.get(role_lower, role_input.title())
+        return _standardize_role(role_input)
 
     def add_cv_content(self, role_name: str, summary: str = None, 
                       bullet_points: List[str] = None, skills: List[str] = None,
                       software: List[str] = None, achievements: List[str] = None,
-                      success_score: float = None):
-        """Add content for a specific role"""
+                      success_score: float = None, cv_count: int = 1):
+        """Add content for a specific role (cv_count CVs at once when batching counts)"""
         
-        standardized_role = self.standardize_role_name(role_name)
+        change = {
+            'role': self.standardize_role_name(role_name),
+            'cv_count': cv_count,
+            'last_updated': self._batch_timestamp or datetime.now().isoformat(),
+        }
+        for content_field, items in (('summaries', [summary] if summary else None), ('bullet_points', bullet_points),
+                                     ('skills', skills), ('software', software), ('achievements', achievements)):
+            if items:
+                change[content_field] = list(items)
+        if success_score:
+            change['success_score'] = success_score
+        
+        role_content = self._apply_change(self.role_database, change)
+        
+        self._pending_changes.append(change)
+        if self._autosave:
+            self._save_role_database()
+        self.logger.info(f"📊 Added content to {role_content.role_name} (CV count: {role_content.cv_count})")
+
+    @staticmethod
+    def _apply_change(database: Dict[str, RoleContent], change: Dict[str, Any]) -> RoleContent:
+        """Apply one add_cv_content change to a role database"""
+        standardized_role = change['role']
         
         # Initialize role if doesn't exist
-        if standardized_role not in self.role_database:
-            self.role_database[standardized_role] = RoleContent(
+        if standardized_role not in database:
+            database[standardized_role] = RoleContent(
                 role_name=standardized_role,
                 summaries=[],
                 bullet_points=[],
@@ -128,43 +421,21 @@ class RoleContentManager(LoggerMixin):
                 success_metrics={}
             )
         
-        role_content = self.role_database[standardized_role]
+        role_content = database[standardized_role]
         
         # Add new content
-        if summary and summary not in role_content.summaries:
-            role_content.summaries.append(summary)
-            
-        if bullet_points:
-            for bullet in bullet_points:
-                if bullet not in role_content.bullet_points:
-                    role_content.bullet_points.append(bullet)
-        
-        if skills:
-            for skill in skills:
-                if skill not in role_content.skills:
-                    role_content.skills.append(skill)
-        
-        if software:
-            for tool in software:
-                if tool not in role_content.software:
-                    role_content.software.append(tool)
-                    
-        if achievements:
-            for achievement in achievements:
-                if achievement not in role_content.achievements:
-                    role_content.achievements.append(achievement)
+        for content_field in CONTENT_FIELDS:
+            if change.get(content_field):
+                role_content.add_unique(content_field, change[content_field])
         
         # Update metadata
-        role_content.cv_count += 1
-        role_content.last_updated = datetime.now().isoformat()
+        role_content.cv_count += change['cv_count']
+        role_content.last_updated = change['last_updated']
         
-        if success_score:
-            if 'fit_scores' not in role_content.success_metrics:
-                role_content.success_metrics['fit_scores'] = []
-            role_content.success_metrics['fit_scores'].append(success_score)
+        if change.get('success_score'):
+            role_content.add_fit_score(change['success_score'])
         
-        self._save_role_database()
-        self.logger.info(f"📊 Added content to {standardized_role} (CV count: {role_content.cv_count})")
+        return role_content
 
     def get_role_content(self, role_name: str) -> Optional[RoleContent]:
         """Get content for a specific role"""
@@ -194,32 +465,18 @@ class RoleContentManager(LoggerMixin):
 
     def find_similar_role_content(self, target_role: str, content_type: str = 'summaries') -> Dict[str, List[str]]:
         """Find similar content from related roles"""
-        
-        # Define role relationships
-        role_relationships = {
-            'Product Manager': ['Product Owner', 'Product Analyst'],
-            'Product Analyst': ['Product Manager', 'Business Analyst', 'Data Analyst'],
-            'Business Analyst': ['Product Analyst', 'Data Analyst', 'Project Manager'],
-            'Data Analyst': ['Product Analyst', 'Business Analyst'],
-            'Project Manager': ['Product Manager', 'Business Analyst'],
-            'Product Owner': ['Product Manager', 'Product Analyst']
-        }
-        
         standardized_role = self.standardize_role_name(target_role)
-        related_roles = role_relationships.get(standardized_role, [])
+        related_roles = ROLE_RELATIONSHIPS.get(standardized_role, ())
+        content_field = SIMILAR_CONTENT_FIELDS.get(content_type)
         
         similar_content = {}
-        for role in [standardized_role] + related_roles:
+        if content_field is None:
+            return similar_content
+        
+        for role in (standardized_role,) + related_roles:
             role_content = self.get_role_content(role)
             if role_content:
-                if content_type == 'summaries':
-                    similar_content[role] = role_content.summaries
-                elif content_type == 'bullets':
-                    similar_content[role] = role_content.bullet_points
-                elif content_type == 'skills':
-                    similar_content[role] = role_content.skills
-                elif content_type == 'software':
-                    similar_content[role] = role_content.software
+                similar_content[role] = getattr(role_content, content_field)
         
         return similar_content
 
@@ -246,7 +503,7 @@ class RoleContentManager(LoggerMixin):
                 'software': len(content.software),
                 'achievements': len(content.achievements),
                 'cv_count': content.cv_count,
-                'avg_success_score': sum(content.success_metrics.get('fit_scores', [0])) / max(len(content.success_metrics.get('fit_scores', [1])), 1)
+                'avg_success_score': content.average_fit_score()
             }
             
             # Add to totals
@@ -263,14 +520,15 @@ class RoleContentManager(LoggerMixin):
         """Migrate existing CVs and user profile data into role-based structure"""
         self.logger.info("🔄 Starting migration of existing data...")
         
-        # 1. Migrate from user profile
-        self._migrate_from_user_profile()
-        
-        # 2. Migrate from existing CVs
-        self._migrate_from_existing_cvs()
-        
-        # 3. Migrate from bullet pool
-        self._migrate_from_bullet_pool()
+        with self.batch():
+            # 1. Migrate from user profile
+            self._migrate_from_user_profile()
+            
+            # 2. Migrate from existing CVs
+            self._migrate_from_existing_cvs()
+            
+            # 3. Migrate from bullet pool
+            self._migrate_from_bullet_pool()
         
         self.logger.info("✅ Migration completed")
 
@@ -279,8 +537,8 @@ class RoleContentManager(LoggerMixin):
         try:
             profile_file = Path("data/user_profiles/user_profile.json")
             if profile_file.exists():
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    profile = json.load(f)
+                raw = profile_file.read_bytes()
+                profile = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 
                 # Extract achievements by role
                 for exp in profile.get('work_experience', []):
@@ -302,30 +560,51 @@ class RoleContentManager(LoggerMixin):
         try:
             output_dir = Path("output")
             if output_dir.exists():
-                for folder in output_dir.iterdir():
-                    if folder.is_dir():
-                        # Extract role from folder name
-                        folder_name = folder.name
-                        role = self._extract_role_from_folder_name(folder_name)
-                        
-                        if role:
-                            # Count CVs for this role
-                            cvs = list(folder.glob("*.docx"))
-                            for cv in cvs:
-                                # For now, just count - could extract actual content later
-                                self.add_cv_content(role_name=role)
+                role_folders = []
+                with os.scandir(output_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Extract role from folder name
+                            role = self._extract_role_from_folder_name(entry.name)
+                            if role:
+                                role_folders.append((role, entry.path))
+                
+                # Count CVs per folder on worker threads (scandir releases the GIL),
+                # then add each role once from this thread
+                cv_counts = Counter()
+                if role_folders:
+                    workers = min(8, (os.cpu_count() or 1) * 2, len(role_folders))
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        counts = pool.map(self._count_cvs_in_folder, [path for _, path in role_folders])
+                        for (role, _), count in zip(role_folders, counts):
+                            cv_counts[role] += count
+                
+                for role, count in cv_counts.items():
+                    if count:
+                        # For now, just count - could extract actual content later
+                        self.add_cv_content(role_name=role, cv_count=count)
                 
                 self.logger.info("📊 Migrated data from existing CVs")
         except Exception as e:
             self.logger.error(f"❌ Error migrating from existing CVs: {e}")
 
+    @staticmethod
+    def _count_cvs_in_folder(folder_path: str) -> int:
+        """Count .docx files directly inside a folder"""
+        with os.scandir(folder_path) as entries:
+            return sum(1 for entry in entries if entry.name.endswith('.docx'))
+
     def _migrate_from_bullet_pool(self):
         """Migrate bullets from bullet pool by role context"""
         try:
-            from .intelligent_bullet_analyzer import EnhancedBulletAnalyzer
+            if not Path(BULLET_POOL_PATH).exists():
+                self.logger.info(f"📭 No bullet pool at {BULLET_POOL_PATH}, skipping")
+                return
             
-            analyzer = EnhancedBulletAnalyzer()
-            bullet_pool = analyzer.bullet_pool
+            if self._bullet_analyzer is None:
+                from .intelligent_bullet_analyzer import EnhancedBulletAnalyzer
+                self._bullet_analyzer = EnhancedBulletAnalyzer(BULLET_POOL_PATH)
+            bullet_pool = self._bullet_analyzer.bullet_pool
             
             # Extract bullets from advanced profile
             advanced_bullets = bullet_pool.get('advanced', {}).get('bullets', {})
@@ -346,41 +625,14 @@ class RoleContentManager(LoggerMixin):
 
     def _extract_role_from_folder_name(self, folder_name: str) -> Optional[str]:
         """Extract role from folder name"""
-        folder_lower = folder_name.lower()
-        
-        if 'product manager' in folder_lower or 'pm' in folder_lower:
-            return 'Product Manager'
-        elif 'product analyst' in folder_lower or 'pa' in folder_lower:
-            return 'Product Analyst'
-        elif 'business analyst' in folder_lower or 'ba' in folder_lower:
-            return 'Business Analyst'
-        elif 'data analyst' in folder_lower or 'da' in folder_lower:
-            return 'Data Analyst'
-        elif 'project manager' in folder_lower or 'pjm' in folder_lower:
-            return 'Project Manager'
-        elif 'product owner' in folder_lower or 'po' in folder_lower:
-            return 'Product Owner'
+        mask = _FOLDER_ROLE_MATCHER.match(folder_name.lower())
+        if not mask:
+            return None
         
-        return None
+        # Earliest role in priority order (lowest set bit) wins
+        return _FOLDER_ROLE_MATCHER.roles[(mask & -mask).bit_length() - 1]
 
     def _infer_roles_from_bullets(self, bullets: List[str]) -> List[str]:
         """Infer roles from bullet content"""
-        roles = set()
-        
-        for bullet in bullets:
-            bullet_lower = bullet.lower()
-            
-            # Role-specific keywords
-            if any(keyword in bullet_lower for keyword in ['product', 'roadmap', 'strategy']):
-                roles.add('Product Manager')
-            if any(keyword in bullet_lower for keyword in ['analysis', 'metrics', 'kpi']):
-                roles.add('Product Analyst')
-            if any(keyword in bullet_lower for keyword in ['business', 'requirements', 'process']):
-                roles.add('Business Analyst')
-            if any(keyword in bullet_lower for keyword in ['data', 'sql', 'tableau']):
-                roles.add('Data Analyst')
-            if any(keyword in bullet_lower for keyword in ['project', 'timeline', 'delivery']):
-                roles.add('Project Manager')
-        
-        return list(roles) if roles else ['Product Analyst']  # Default fallback
+        return list(_infer_roles(tuple(bullets)))
 
@@ -3,17 +3,232 @@ Template Learning System - Machine Learning for Template Selection
 CVPilot - Learns from user selections and improves template recommendations
 """
 
-import json
+import atexit
+import functools
 import os
+import re
+import threading
+import weakref
+from array import array
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from dataclasses import dataclass, field, fields
+from collections import Counter, defaultdict, deque
 import numpy as np
 
-@dataclass
+from .json_io import end_torn_line, json_line, parse_json, read_json, write_json
+
+try:
+    from numba import guvectorize, njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Job title phrases -> role identifiers, in priority order
+ROLE_TITLE_CODES = (
+    ('product analyst', 'PA'),
+    ('data analyst', 'DA'),
+    ('product manager', 'PM'),
+    ('product owner', 'PO'),
+    ('project manager', 'PJM'),
+    ('business analyst', 'BA'),
+)
+_ROLE_TITLE_PATTERN = re.compile('|'.join(re.escape(phrase) for phrase, _ in ROLE_TITLE_CODES))
+
+
+@functools.lru_cache(maxsize=2048)
+def _role_from_title(job_title: str) -> str:
+    """Role identifier for a job title: one regex pass, then the highest-priority phrase found"""
+    found = set(_ROLE_TITLE_PATTERN.findall(job_title.lower()))
+    for phrase, code in ROLE_TITLE_CODES:
+        if phrase in found:
+            return code
+    return 'UNKNOWN'
+
+
+# Industry keywords, in priority order
+INDUSTRY_KEYWORDS = MappingProxyType({
+    "Technology/SaaS": ("saas", "software", "cloud", "digital", "platform", "api", "web", "mobile", "tech"),
+    "Manufacturing": ("manufacturing", "production", "industrial", "supply chain", "factory"),
+    "Financial Services": ("financial", "fintech", "banking", "payment", "trading", "investment"),
+    "Healthcare": ("healthcare", "medical", "clinical", "patient", "pharma", "biotech"),
+    "Retail/E-commerce": ("retail", "ecommerce", "customer", "sales", "commerce"),
+    "Consulting": ("consulting", "advisory", "strategy", "transformation"),
+    "Business Operations": ("operations", "business", "management", "process")
+})
+_INDUSTRY_NAMES = tuple(INDUSTRY_KEYWORDS)
+
+# One group per industry inside a lookahead, so overlapping keywords ('tech' in 'biotech') are all seen
+_INDUSTRY_PATTERN = re.compile('(?=(?:' + '|'.join(
+    f"(?P<i{i}>{'|'.join(re.escape(kw) for kw in keywords)})"
+    for i, keywords in enumerate(INDUSTRY_KEYWORDS.values())
+) + '))')
+
+
+@functools.lru_cache(maxsize=1024)
+def _infer_industry(company: str, title: str, skills: Tuple[str, ...]) -> str:
+    """Highest-priority industry with a keyword in the company, title or skills"""
+    text_to_analyze = f"{company.lower()} {title.lower()} {' '.join(skills).lower()}"
+    found = {match.lastgroup for match in _INDUSTRY_PATTERN.finditer(text_to_analyze)}
+    for i, industry in enumerate(_INDUSTRY_NAMES):
+        if f"i{i}" in found:
+            return industry
+
+    return "Business Operations"  # Default
+
+
+@functools.lru_cache(maxsize=256)
+def _skill_sets(skills: Tuple[str, ...], software: Tuple[str, ...]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Job skills and software as sets, built once per distinct job"""
+    return frozenset(skills), frozenset(software)
+
+
+# Most recent selections kept in memory; the full log lives in selection_history.jsonl
+RECENT_SELECTIONS_KEPT = 1024
+
+# Summary similarity weights: role, industry, skills overlap, software overlap
+SIMILARITY_TOTAL_WEIGHT = 0.4 + 0.3 + 0.2 + 0.1
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_DAY_US = 86_400_000_000
+
+
+def _naive_epoch_us(moment: datetime) -> int:
+    """Whole microseconds since 1970-01-01 for a naive datetime"""
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _score_summaries(target_role: int, unknown_role: int, target_industry: int,
+                     skill_mask: np.ndarray, n_skills: int, software_mask: np.ndarray, n_software: int,
+                     role_codes: np.ndarray, industry_codes: np.ndarray, created_us: np.ndarray,
+                     now_us: int, success: np.ndarray, token_ids: np.ndarray, offsets: np.ndarray,
+                     total_weight: float, min_similarity: float, rows: np.ndarray) -> np.ndarray:
+    """Similarity of stored summaries to one target job: role, industry, skills and software, scaled by age and success
+
+    Only the given rows are scored, in order. Summaries that could not reach min_similarity even with
+    full skill/software overlap score 0.
+    """
+    scores = np.zeros(rows.shape[0])
+    for k in range(rows.shape[0]):
+        i = rows[k]
+        score = 0.0
+
+        # Role match (40% weight)
+        if role_codes[i] == target_role:
+            score += 0.4
+        elif role_codes[i] != unknown_role:
+            score += 0.1  # Partial credit for related roles
+
+        # Industry match (30% weight)
+        if industry_codes[i] == target_industry:
+            score += 0.3
+
+        # Age penalty (older summaries get slightly lower scores)
+        days_old = (now_us - created_us[i]) // _DAY_US
+        age_factor = 1 - min(days_old / 365, 0.2)  # Max 20% penalty for very old summaries
+
+        # Success score bonus
+        success_factor = 1 + min(success[i], 0.3)  # Max 30% bonus
+
+        # Skip the word overlap when even a perfect one cannot qualify
+        if (score + 0.2 + 0.1) * age_factor * success_factor / total_weight < min_similarity:
+            continue
+
+        # Skills (20%) and software/tools (10%) overlap with the summary's words
+        skill_hits = 0
+        software_hits = 0
+        for j in range(offsets[i], offsets[i + 1]):
+            skill_hits += skill_mask[token_ids[j]]
+            software_hits += software_mask[token_ids[j]]
+        score += skill_hits / max(n_skills, 1) * 0.2
+        score += software_hits / max(n_software, 1) * 0.1
+
+        scores[k] = score * age_factor * success_factor / total_weight
+    return scores
+
+
+if NUMBA_AVAILABLE:
+    _score_summaries = njit(cache=True)(_score_summaries)
+
+
+def _combine_ml_scores(rows: np.ndarray, base_scores: np.ndarray, total: np.ndarray, success: np.ndarray,
+                       avg_rating: np.ndarray, role_values: np.ndarray, out: np.ndarray):
+    """70% base score + 30% ML boost per candidate (see _calculate_ml_boost); rows < 0 are untracked"""
+    for i in range(rows.shape[0]):
+        boost = 0.0
+        row = rows[i]
+        if row >= 0:
+            if total[row] > 0:
+                boost = success[row] * 0.3
+            if avg_rating[row] > 0:
+                boost += (avg_rating[row] / 5.0) * 0.4
+            if not np.isnan(role_values[row]):
+                boost += role_values[row] * 0.3
+            boost = min(boost, 1.0)
+        out[i] = base_scores[i] * 0.7 + boost * 0.3
+
+
+if NUMBA_AVAILABLE:
+    _combine_ml_scores = guvectorize(
+        ['void(int64[:], float64[:], int64[:], float64[:], float64[:], float64[:], float64[:])'],
+        '(n),(n),(m),(m),(m),(m)->(n)', nopython=True, cache=True)(_combine_ml_scores)
+
+
+class _SummaryIndex:
+    """Successful summaries packed into parallel arrays for _score_summaries"""
+
+    def __init__(self, summaries: List['SuccessfulSummary']):
+        self.size = len(summaries)
+        self.role_ids: Dict[str, int] = {}
+        self.industry_ids: Dict[str, int] = {}
+        self.token_ids: Dict[str, int] = {}
+
+        tokens: List[int] = []
+        offsets = [0]
+        for summary in summaries:
+            for token in summary._tokens:
+                tokens.append(self.token_ids.setdefault(token, len(self.token_ids)))
+            offsets.append(len(tokens))
+
+        self.roles = np.array([self.role_ids.setdefault(s.role_type, len(self.role_ids)) for s in summaries],
+                              dtype=np.int32)
+        self.industries = np.array([self.industry_ids.setdefault(s.industry, len(self.industry_ids))
+                                    for s in summaries], dtype=np.int32)
+        self.created_us = np.array([s._created_us for s in summaries], dtype=np.int64)
+        self.newest_us = int(self.created_us.max()) if self.size else 0
+        self.success = np.array([s.success_score for s in summaries], dtype=np.float64)
+        self.tokens = np.array(tokens, dtype=np.int32)
+        self.offsets = np.array(offsets, dtype=np.int64)
+
+    def _token_mask(self, words: set) -> np.ndarray:
+        """1 for vocabulary tokens in words, else 0"""
+        mask = np.zeros(len(self.token_ids), dtype=np.int64)
+        for word in words:
+            token = self.token_ids.get(word)
+            if token is not None:
+                mask[token] = 1
+        return mask
+
+    def score(self, target_role: str, target_industry: str,
+              target_skills: FrozenSet[str], target_software: FrozenSet[str],
+              min_similarity: float = 0.0, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Similarity of the given summaries (default all) to the target job (0 where it cannot reach min_similarity)"""
+        if rows is None:
+            rows = np.arange(self.size, dtype=np.int64)
+        return _score_summaries(
+            self.role_ids.get(target_role, -1), self.role_ids.get('UNKNOWN', -2),
+            self.industry_ids.get(target_industry, -1),
+            self._token_mask(target_skills), len(target_skills),
+            self._token_mask(target_software), len(target_software),
+            self.roles, self.industries, self.created_us, _naive_epoch_us(datetime.now()),
+            self.success, self.tokens, self.offsets, SIMILARITY_TOTAL_WEIGHT, min_similarity, rows
+        )
+
+@dataclass(slots=True)
 class SelectionHistory:
     """Tracks user template selections for learning"""
     job_id: str
@@ -29,6 +244,10 @@ class SelectionHistory:
         if not self.timestamp:
             self.timestamp = datetime.now().isoformat()
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form (shallow, no per-field copies)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 @dataclass
 class SuccessfulSummary:
     """Tracks successful summaries for reuse"""
@@ -41,38 +260,78 @@ class SuccessfulSummary:
     created_at: str = ""
     last_used: Optional[str] = None
     fit_score_improvement: float = 0.0
+    # Derived once from summary_text / created_at for similarity scoring (not persisted)
+    _tokens: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _created_us: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if not self.created_at:
-            self.created_at = datetime.now().isoformat()
+        try:
+            created = datetime.fromisoformat(self.created_at) if self.created_at else None
+        except ValueError:
+            created = None  # Unreadable timestamps are treated like missing ones
+        if created is None:
+            created = datetime.now()
+            self.created_at = created.isoformat()
 
-@dataclass
+        self._created_us = _naive_epoch_us(created)
+        self._tokens = frozenset(self.summary_text.lower().split())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form without the derived fields"""
+        return {name: getattr(self, name) for name in _SUMMARY_PERSISTED_FIELDS}
+
+# Field names resolved once rather than via dataclasses.fields() on every save
+_SUMMARY_PERSISTED_FIELDS = tuple(f.name for f in fields(SuccessfulSummary) if f.init)
+
+@dataclass(slots=True)
 class TemplatePerformance:
     """Tracks performance metrics for each template"""
     template_path: str
     total_selections: int = 0
-    user_ratings: List[float] = None
+    user_ratings: array = None  # Unboxed doubles ('d')
     success_rate: float = 0.0
     avg_user_rating: float = 0.0
     role_performance: Dict[str, float] = None
     skill_performance: Dict[str, float] = None
     last_used: Optional[str] = None
+    sum_user_ratings: float = 0.0  # Running total behind avg_user_rating
 
     def __post_init__(self):
-        if self.user_ratings is None:
-            self.user_ratings = []
+        if not isinstance(self.user_ratings, array):
+            self.user_ratings = array('d', self.user_ratings or ())
+        if self.user_ratings and not self.sum_user_ratings:
+            self.sum_user_ratings = float(sum(self.user_ratings))
         if self.role_performance is None:
             self.role_performance = {}
         if self.skill_performance is None:
             self.skill_performance = {}
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form, ratings as a plain list"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['user_ratings'] = self.user_ratings.tolist()
+        return data
+
+# Live learning systems, flushed by one exit hook; a pending flush timer keeps an instance alive until it saves
+_LIVE_SYSTEMS: 'weakref.WeakSet[TemplateLearningSystem]' = weakref.WeakSet()
+
+
+def _flush_live_systems():
+    """Write pending changes of every live learning system (registered with atexit)"""
+    for system in list(_LIVE_SYSTEMS):
+        system.flush()
+
+
+atexit.register(_flush_live_systems)
+
 class TemplateLearningSystem:
     """Machine learning system that learns from user template selections"""
 
     def __init__(self, data_dir: str = "./data/learning"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self.history_file = self.data_dir / "selection_history.json"
+        self.history_file = self.data_dir / "selection_history.jsonl"  # Append-only, one selection per line
+        self.legacy_history_file = self.data_dir / "selection_history.json"
         self.performance_file = self.data_dir / "template_performance.json"
         self.successful_summaries_file = self.data_dir / "successful_summaries.json"
         self.logger = logging.getLogger(__name__)
@@ -82,11 +341,43 @@ class TemplateLearningSystem:
         self.decay_factor = 0.95  # How much older selections are weighted
         self.confidence_threshold = 0.7  # Minimum confidence for ML suggestions
         self.min_fit_improvement = 0.05  # Minimum fit score improvement to consider successful
+        self.summary_duplicate_threshold = 0.95  # Word overlap above which a new summary reinforces an existing one
+        self.summary_novelty_threshold = 0.9  # Word overlap below which a new summary is stored
+
+        # Template performance is rewritten once enough of it changed (or every N selections)
+        self.performance_save_fraction = 0.1
+        self.performance_save_every = 10
+        self._dirty_templates = set()
+        self._unsaved_selections = 0
+
+        # Remaining changes are written by a background timer instead of on every call
+        self.flush_interval = 5.0  # Seconds
+        self._summaries_dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.RLock()
 
         # Load existing data
+        self._history_count = 0
         self.selection_history = self._load_selection_history()
         self.template_performance = self._load_template_performance()
         self.successful_summaries = self._load_successful_summaries()
+        self._summary_index: Optional[_SummaryIndex] = None  # Rebuilt when summaries are added
+        # Rows of successful_summaries per (role, industry); the list only ever grows
+        self._summaries_by_key: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        for row, summary in enumerate(self.successful_summaries):
+            self._summaries_by_key[(summary.role_type, summary.industry)].append(row)
+
+        # Template performance mirrored as parallel arrays (one row per template) for vector ranking
+        self._template_index: Dict[str, int] = {}
+        self._perf_total = np.zeros(0, dtype=np.int64)
+        self._perf_success = np.zeros(0)
+        self._perf_avg_rating = np.zeros(0)
+        self._perf_role: Dict[str, np.ndarray] = {}  # role key -> per-template performance, NaN if unseen
+        for template_path in self.template_performance:
+            self._set_performance_row(template_path)
+
+        # Write any pending changes on interpreter exit
+        _LIVE_SYSTEMS.add(self)
 
     def record_selection(self, job_data: Dict[str, Any], selected_template: str,
                         auto_selected: bool = False, selection_score: float = 0.0,
@@ -103,9 +394,19 @@ class TemplateLearningSystem:
             outcome=outcome
         )
 
-        self.selection_history.append(history_entry)
-        self._update_template_performance(history_entry, job_data)
-        self._save_data()
+        with self._save_lock:
+            self.selection_history.append(history_entry)
+            self._history_count += 1
+            self._append_selection(history_entry)
+            self._update_template_performance(history_entry, job_data)
+
+            self._dirty_templates.add(selected_template)
+            self._unsaved_selections += 1
+            if (len(self._dirty_templates) >= self.performance_save_fraction * len(self.template_performance)
+                    or self._unsaved_selections >= self.performance_save_every):
+                self._save_template_performance()
+            else:
+                self._schedule_flush()
 
         self.logger.info(f"📚 Recorded selection: {selected_template} for job {job_data.get('job_title_original', '')}")
 
@@ -116,47 +417,84 @@ class TemplateLearningSystem:
         Returns:
             Tuple of (template_path, confidence_score, explanation)
         """
-        if len(self.selection_history) < self.min_samples_for_learning:
+        if self._history_count < self.min_samples_for_learning:
             return None
 
-        job_title = job_data.get('job_title_original', '').lower()
-        job_skills = set(job_data.get('skills', []))
-        job_software = set(job_data.get('software', []))
-
-        best_template = None
-        best_score = 0.0
-        best_reason = ""
-
-        for candidate in candidate_templates:
-            template_path = str(candidate.file_path)
-
-            # Get base scoring from current system
-            base_score = candidate.score
+        if not candidate_templates:
+            return None
 
-            # Get ML performance boost
-            ml_boost, ml_reason = self._calculate_ml_boost(template_path, job_title, job_skills, job_software)
+        job_title = job_data.get('job_title_original', '').lower()
 
-            # Combine scores
-            total_score = base_score * 0.7 + ml_boost * 0.3  # 70% base, 30% ML
+        # Base scoring from current system combined with ML performance boost for all candidates at once
+        template_paths = [str(candidate.file_path) for candidate in candidate_templates]
+        base_scores = np.array([candidate.score for candidate in candidate_templates], dtype=np.float64)
+        role_key = self._extract_role_from_title(job_title)
+        total_scores = self._ml_scores(template_paths, base_scores, role_key)
 
-            if total_score > best_score and total_score >= self.confidence_threshold:
-                best_score = total_score
-                best_template = template_path
-                best_reason = f"ML Boost: {ml_reason} | Base Score: {base_score:.2f}"
+        # First candidate with the highest qualifying score wins
+        qualifying = np.where(total_scores >= self.confidence_threshold, total_scores, -np.inf)
+        best = int(np.argmax(qualifying))
+        if qualifying[best] <= 0.0:
+            return None
 
-        if best_template:
-            return (best_template, best_score, best_reason)
+        best_template = template_paths[best]
+        base_score = candidate_templates[best].score
+        job_skills, job_software = self._job_skill_sets(job_data)
+        _, ml_reason = self._calculate_ml_boost(best_template, job_title, job_skills, job_software, role_key)
+        best_reason = f"ML Boost: {ml_reason} | Base Score: {base_score:.2f}"
+
+        return (best_template, float(total_scores[best]), best_reason)
+
+    def _ml_scores(self, template_paths: List[str], base_scores: np.ndarray, role_key: str) -> np.ndarray:
+        """Combined base + ML score per template (70% base, 30% ML; no boost when untracked)"""
+        rows = np.array([self._template_index.get(path, -1) for path in template_paths], dtype=np.int64)
+        if (rows >= 0).any():
+            # Templates with too few selections get no boost, as in _calculate_ml_boost
+            cold = self._perf_total[np.maximum(rows, 0)] < self.min_samples_for_learning
+            rows = np.where(cold, -1, rows)
+        if not (rows >= 0).any():
+            return base_scores * 0.7
+
+        role_values = self._perf_role.get(role_key)
+        if role_values is None:
+            role_values = np.full(len(self._template_index), np.nan)
+
+        scores = np.empty(len(template_paths))
+        _combine_ml_scores(rows, base_scores, self._perf_total, self._perf_success,
+                           self._perf_avg_rating, role_values, scores)
+        return scores
+
+    def _set_performance_row(self, template_path: str):
+        """Mirror one template's performance into the parallel arrays"""
+        perf = self.template_performance[template_path]
 
-        return None
+        row = self._template_index.get(template_path)
+        if row is None:
+            row = self._template_index[template_path] = len(self._template_index)
+            self._perf_total = np.append(self._perf_total, 0)
+            self._perf_success = np.append(self._perf_success, 0.0)
+            self._perf_avg_rating = np.append(self._perf_avg_rating, 0.0)
+            for role_key, values in self._perf_role.items():
+                self._perf_role[role_key] = np.append(values, np.nan)
+
+        self._perf_total[row] = perf.total_selections
+        self._perf_success[row] = perf.success_rate
+        self._perf_avg_rating[row] = perf.avg_user_rating
+        for role_key, value in perf.role_performance.items():
+            if role_key not in self._perf_role:
+                self._perf_role[role_key] = np.full(len(self._template_index), np.nan)
+            self._perf_role[role_key][row] = value
 
     def _calculate_ml_boost(self, template_path: str, job_title: str,
-                           job_skills: set, job_software: set) -> Tuple[float, str]:
-        """Calculate ML performance boost for a template"""
+                           job_skills: set, job_software: set, role_key: Optional[str] = None) -> Tuple[float, str]:
+        """Calculate ML performance boost for a template (role_key: job title's role, if already known)"""
 
         if template_path not in self.template_performance:
             return (0.0, "No historical data")
 
         perf = self.template_performance[template_path]
+        if perf.total_selections < self.min_samples_for_learning:
+            return (0.0, "Insufficient history")  # Too few selections to say anything
 
         boost_score = 0.0
         reasons = []
@@ -176,7 +514,8 @@ class TemplateLearningSystem:
                 reasons.append(f"Avg rating: {perf.avg_user_rating:.1f}/5")
 
         # 3. Role-specific performance (30%)
-        role_key = self._extract_role_from_title(job_title)
+        if role_key is None:
+            role_key = self._extract_role_from_title(job_title)
         if role_key in perf.role_performance:
             role_score = perf.role_performance[role_key] * 0.3
             boost_score += role_score
@@ -189,22 +528,7 @@ class TemplateLearningSystem:
 
     def _extract_role_from_title(self, job_title: str) -> str:
         """Extract role identifier from job title"""
-        title_lower = job_title.lower()
-
-        role_mappings = {
-            'product analyst': 'PA',
-            'data analyst': 'DA',
-            'product manager': 'PM',
-            'product owner': 'PO',
-            'project manager': 'PJM',
-            'business analyst': 'BA'
-        }
-
-        for key, value in role_mappings.items():
-            if key in title_lower:
-                return value
-
-        return 'UNKNOWN'
+        return _role_from_title(job_title)
 
     def _update_template_performance(self, selection: SelectionHistory, job_data: Dict[str, Any]):
         """Update performance metrics for a template"""
@@ -222,7 +546,8 @@ class TemplateLearningSystem:
 
         if selection.user_rating:
             perf.user_ratings.append(selection.user_rating)
-            perf.avg_user_rating = np.mean(perf.user_ratings)
+            perf.sum_user_ratings += selection.user_rating
+            perf.avg_user_rating = perf.sum_user_ratings / len(perf.user_ratings)
 
         # Update success rate
         if selection.outcome == "success":
@@ -241,63 +566,123 @@ class TemplateLearningSystem:
         elif selection.outcome in ["modified", "rejected"]:
             perf.role_performance[role_key] = perf.role_performance[role_key] / 2
 
-    def _load_selection_history(self) -> List[SelectionHistory]:
-        """Load selection history from file"""
+        self._set_performance_row(template_path)
+
+    def _load_selection_history(self) -> deque:
+        """Load the most recent selections from file and count all of them"""
         if not self.history_file.exists():
+            history = self._migrate_legacy_history()
+            self._history_count = len(history)
+            return deque(history, maxlen=RECENT_SELECTIONS_KEPT)
+
+        # Stream the log keeping only the newest selections; a torn or corrupt line only loses that record
+        history = deque(maxlen=RECENT_SELECTIONS_KEPT)
+        count = 0
+        skipped = 0
+        try:
+            with open(self.history_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        history.append(SelectionHistory(**parse_json(line)))
+                    except (ValueError, TypeError):
+                        skipped += 1
+                        continue
+                    count += 1
+            end_torn_line(self.history_file)
+        except OSError as e:
+            self.logger.error(f"Error loading selection history: {e}")
+
+        if skipped:
+            self.logger.warning(f"⚠️ Skipped {skipped} unreadable lines in {self.history_file.name}")
+        self._history_count = count
+        return history
+
+    def _migrate_legacy_history(self) -> List[SelectionHistory]:
+        """Convert the old whole-array selection_history.json into the JSONL log"""
+        if not self.legacy_history_file.exists():
             return []
 
         try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [SelectionHistory(**item) for item in data]
+            history = [SelectionHistory(**item) for item in read_json(self.legacy_history_file)]
+
+            # Write the whole log before it appears, so a partial migration is retried on the next run
+            tmp_path = self.history_file.with_suffix(self.history_file.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(json_line(item.to_dict()) for item in history)
+            tmp_path.replace(self.history_file)
+            self.logger.info(f"Migrated {len(history)} selections to {self.history_file.name}")
+            return history
         except Exception as e:
-            self.logger.error(f"Error loading selection history: {e}")
+            self.logger.error(f"Error migrating selection history: {e}")
             return []
 
+    def _append_selection(self, entry: SelectionHistory):
+        """Append one selection to the history log"""
+        try:
+            with open(self.history_file, 'a', encoding='utf-8') as f:
+                f.write(json_line(entry.to_dict()))
+        except Exception as e:
+            self.logger.error(f"Error saving selection history: {e}")
+
     def _load_template_performance(self) -> Dict[str, TemplatePerformance]:
         """Load template performance data from file"""
         if not self.performance_file.exists():
             return {}
 
         try:
-            with open(self.performance_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                result = {}
-                for key, value in data.items():
-                    # Convert nested dicts back to proper format
-                    if 'user_ratings' in value and isinstance(value['user_ratings'], list):
-                        value['user_ratings'] = value['user_ratings']
-                    if 'role_performance' in value and isinstance(value['role_performance'], dict):
-                        value['role_performance'] = value['role_performance']
-                    if 'skill_performance' in value and isinstance(value['skill_performance'], dict):
-                        value['skill_performance'] = value['skill_performance']
-                    result[key] = TemplatePerformance(**value)
-                return result
+            data = read_json(self.performance_file)
+            result = {}
+            for key, value in data.items():
+                # Convert nested dicts back to proper format
+                if 'user_ratings' in value and isinstance(value['user_ratings'], list):
+                    value['user_ratings'] = array('d', value['user_ratings'])
+                if 'role_performance' in value and isinstance(value['role_performance'], dict):
+                    value['role_performance'] = value['role_performance']
+                if 'skill_performance' in value and isinstance(value['skill_performance'], dict):
+                    value['skill_performance'] = value['skill_performance']
+                result[key] = TemplatePerformance(**value)
+            return result
         except Exception as e:
             self.logger.error(f"Error loading template performance: {e}")
             return {}
 
-    def _save_data(self):
-        """Save all learning data to files"""
+    def _save_template_performance(self):
+        """Save template performance data to file"""
         try:
-            # Save selection history
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump([asdict(item) for item in self.selection_history], f, indent=2, ensure_ascii=False)
-
-            # Save template performance
-            with open(self.performance_file, 'w', encoding='utf-8') as f:
-                json.dump({k: asdict(v) for k, v in self.template_performance.items()},
-                         f, indent=2, ensure_ascii=False)
+            write_json(self.performance_file,
+                        {k: v.to_dict() for k, v in self.template_performance.items()})
 
+            self._dirty_templates.clear()
+            self._unsaved_selections = 0
         except Exception as e:
             self.logger.error(f"Error saving learning data: {e}")
 
+    def _schedule_flush(self):
+        """Start the background flush timer unless one is already pending"""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """Save template performance and successful summaries changed since the last save"""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._unsaved_selections:
+                self._save_template_performance()
+            if self._summaries_dirty:
+                self._save_successful_summaries()
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get learning system statistics"""
-        total_selections = len(self.selection_history)
+        total_selections = self._history_count
         templates_with_ratings = len([p for p in self.template_performance.values() if p.user_ratings])
-        avg_rating = np.mean([p.avg_user_rating for p in self.template_performance.values()
-                             if p.avg_user_rating > 0]) if templates_with_ratings > 0 else 0
+        rated = self._perf_avg_rating[self._perf_avg_rating > 0]  # Running averages, one per template
+        avg_rating = rated.mean() if templates_with_ratings > 0 and rated.size else 0
 
         return {
             'total_selections': total_selections,
@@ -328,10 +713,36 @@ class TemplateLearningSystem:
             fit_score_improvement=fit_score_improvement
         )
 
-        self.successful_summaries.append(successful_summary)
-        self._save_successful_summaries()
-
-        self.logger.info(f"💡 Recorded successful summary for {role_type} role in {industry} industry")
+        closest, overlap = self._closest_stored_summary(successful_summary)
+        if self.summary_novelty_threshold <= overlap <= self.summary_duplicate_threshold:
+            self.logger.info(f"⏭️ Skipped summary too close to a stored {role_type} summary (overlap: {overlap:.2f})")
+            return
+
+        with self._save_lock:
+            if overlap > self.summary_duplicate_threshold:
+                closest.usage_count += 1  # Same summary again: reinforce the stored one
+            else:
+                self._summaries_by_key[(role_type, industry)].append(len(self.successful_summaries))
+                self.successful_summaries.append(successful_summary)
+            self._summaries_dirty = True
+            self._schedule_flush()
+
+        if overlap > self.summary_duplicate_threshold:
+            self.logger.info(f"💡 Reinforced stored summary for {role_type} role in {industry} industry")
+        else:
+            self.logger.info(f"💡 Recorded successful summary for {role_type} role in {industry} industry")
+
+    def _closest_stored_summary(self, candidate: SuccessfulSummary) -> Tuple[Optional[SuccessfulSummary], float]:
+        """Stored summary for the same role and industry with the highest word overlap (Jaccard) with candidate"""
+        closest = None
+        best_overlap = 0.0
+        for row in self._summaries_by_key.get((candidate.role_type, candidate.industry), ()):
+            summary = self.successful_summaries[row]
+            union = len(summary._tokens | candidate._tokens)
+            overlap = len(summary._tokens & candidate._tokens) / union if union else 1.0
+            if overlap > best_overlap:
+                closest, best_overlap = summary, overlap
+        return closest, best_overlap
 
     def find_similar_successful_summary(self, job_data: Dict[str, Any], min_similarity: float = 0.6) -> Optional[str]:
         """Find a similar successful summary to reuse"""
@@ -341,97 +752,65 @@ class TemplateLearningSystem:
 
         target_role = self._extract_role_from_title(job_data.get('job_title_original', ''))
         target_industry = self._infer_industry_from_job_data(job_data)
-        target_skills = set(job_data.get('skills', []))
-        target_software = set(job_data.get('software', []))
-
-        best_match = None
-        best_score = 0.0
+        target_skills, target_software = self._job_skill_sets(job_data)
 
-        for summary in self.successful_summaries:
-            # Calculate similarity score
-            similarity = self._calculate_summary_similarity(
-                summary, target_role, target_industry, target_skills, target_software
-            )
+        if self._summary_index is None or self._summary_index.size != len(self.successful_summaries):
+            self._summary_index = _SummaryIndex(self.successful_summaries)
+        rows = self._candidate_summary_rows(target_role, target_industry, min_similarity)
+        if not rows.size:
+            return None
+        similarities = self._summary_index.score(target_role, target_industry, target_skills, target_software,
+                                                 min_similarity, rows)
 
-            if similarity > min_similarity and similarity > best_score:
-                best_score = similarity
-                best_match = summary.summary_text
+        # Summaries that raised the running best (in list order) each count as used
+        qualifying = np.where(similarities > min_similarity, similarities, 0.0)
+        previous_best = np.maximum.accumulate(np.concatenate(([0.0], qualifying[:-1])))
+        improved = np.flatnonzero(qualifying > previous_best)
 
-                # Update usage statistics
-                summary.usage_count += 1
-                summary.last_used = datetime.now().isoformat()
+        best_match = None
+        best_score = 0.0
+        if improved.size:
+            now = datetime.now().isoformat()
+            with self._save_lock:
+                for i in rows[improved]:
+                    summary = self.successful_summaries[i]
+                    summary.usage_count += 1
+                    summary.last_used = now
+                self._summaries_dirty = True
+                self._schedule_flush()
+            best_score = float(similarities[improved[-1]])
+            best_match = self.successful_summaries[rows[improved[-1]]].summary_text
 
         if best_match:
-            self._save_successful_summaries()
             self.logger.info(f"🔄 Reusing successful summary (similarity: {best_score:.2f})")
 
         return best_match
 
-    def _calculate_summary_similarity(self, summary: SuccessfulSummary, target_role: str,
-                                    target_industry: str, target_skills: set, target_software: set) -> float:
-        """Calculate how similar a stored summary is to the current job requirements"""
-
-        score = 0.0
-        total_weight = 0.0
-
-        # Role match (40% weight)
-        if summary.role_type == target_role:
-            score += 0.4
-        elif summary.role_type != 'UNKNOWN':
-            score += 0.1  # Partial credit for related roles
-        total_weight += 0.4
-
-        # Industry match (30% weight)
-        if summary.industry == target_industry:
-            score += 0.3
-        total_weight += 0.3
-
-        # Skills overlap (20% weight)
-        summary_skills = set(summary.summary_text.lower().split())
-        skill_overlap = len(target_skills.intersection(summary_skills)) / max(len(target_skills), 1)
-        score += skill_overlap * 0.2
-        total_weight += 0.2
-
-        # Software/tools overlap (10% weight)
-        summary_software = set(summary.summary_text.lower().split())
-        software_overlap = len(target_software.intersection(summary_software)) / max(len(target_software), 1)
-        score += software_overlap * 0.1
-        total_weight += 0.1
-
-        # Age penalty (older summaries get slightly lower scores)
-        days_old = (datetime.now() - datetime.fromisoformat(summary.created_at)).days
-        age_penalty = min(days_old / 365, 0.2)  # Max 20% penalty for very old summaries
-        score *= (1 - age_penalty)
-
-        # Success score bonus
-        success_bonus = min(summary.success_score, 0.3)  # Max 30% bonus
-        score *= (1 + success_bonus)
-
-        return score / total_weight if total_weight > 0 else 0.0
+    def _candidate_summary_rows(self, target_role: str, target_industry: str, min_similarity: float) -> np.ndarray:
+        """Rows (in list order) of the (role, industry) buckets whose summaries could reach min_similarity"""
+        # Best case for any summary: newest age factor, full success bonus, full skill/software overlap
+        days_old = (_naive_epoch_us(datetime.now()) - self._summary_index.newest_us) // _DAY_US
+        best_factor = (1 - min(days_old / 365, 0.2)) * 1.3
+
+        rows: List[int] = []
+        for (role_type, industry), bucket in self._summaries_by_key.items():
+            score = 0.4 if role_type == target_role else 0.1 if role_type != 'UNKNOWN' else 0.0
+            if industry == target_industry:
+                score += 0.3
+            # Small tolerance so float rounding never drops a bucket the kernel would keep
+            if (score + 0.2 + 0.1) * best_factor / SIMILARITY_TOTAL_WEIGHT >= min_similarity - 1e-9:
+                rows.extend(bucket)
+        rows.sort()
+        return np.array(rows, dtype=np.int64)
+
+    def _job_skill_sets(self, job_data: Dict[str, Any]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """(skills, software) of a job as frozensets"""
+        return _skill_sets(tuple(job_data.get('skills', [])), tuple(job_data.get('software', [])))
 
     def _infer_industry_from_job_data(self, job_data: Dict[str, Any]) -> str:
         """Infer industry from job data"""
-        company = job_data.get('company', '').lower()
-        title = job_data.get('job_title_original', '').lower()
-        skills = ' '.join(job_data.get('skills', [])).lower()
-
-        text_to_analyze = f"{company} {title} {skills}"
-
-        industry_keywords = {
-            "Technology/SaaS": ["saas", "software", "cloud", "digital", "platform", "api", "web", "mobile", "tech"],
-            "Manufacturing": ["manufacturing", "production", "industrial", "supply chain", "factory"],
-            "Financial Services": ["financial", "fintech", "banking", "payment", "trading", "investment"],
-            "Healthcare": ["healthcare", "medical", "clinical", "patient", "pharma", "biotech"],
-            "Retail/E-commerce": ["retail", "ecommerce", "customer", "sales", "commerce"],
-            "Consulting": ["consulting", "advisory", "strategy", "transformation"],
-            "Business Operations": ["operations", "business", "management", "process"]
-        }
-
-        for industry, keywords in industry_keywords.items():
-            if any(keyword in text_to_analyze for keyword in keywords):
-                return industry
-
-        return "Business Operations"  # Default
+        return _infer_industry(job_data.get('company', ''), job_data.get('job_title_original', ''),
+                               tuple(job_data.get('skills', [])))
 
     def _load_successful_summaries(self) -> List[SuccessfulSummary]:
         """Load successful summaries from file"""
@@ -439,9 +818,7 @@ class TemplateLearningSystem:
             return []
 
         try:
-            with open(self.successful_summaries_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [SuccessfulSummary(**item) for item in data]
+            return [SuccessfulSummary(**item) for item in read_json(self.successful_summaries_file)]
         except Exception as e:
             self.logger.error(f"Error loading successful summaries: {e}")
             return []
@@ -449,9 +826,9 @@ class TemplateLearningSystem:
     def _save_successful_summaries(self):
         """Save successful summaries to file"""
         try:
-            with open(self.successful_summaries_file, 'w', encoding='utf-8') as f:
-                json.dump([asdict(item) for item in self.successful_summaries],
-                         f, indent=2, ensure_ascii=False)
+            write_json(self.successful_summaries_file,
+                        [item.to_dict() for item in self.successful_summaries])
+            self._summaries_dirty = False
         except Exception as e:
             self.logger.error(f"Error saving successful summaries: {e}")
 
@@ -459,26 +836,22 @@ class TemplateLearningSystem:
         """Get comprehensive learning statistics"""
         base_stats = self.get_statistics()
 
+        # Single pass over the summaries for counts and the improvement total
+        by_role = Counter()
+        by_industry = Counter()
+        total_improvement = 0.0
+        for summary in self.successful_summaries:
+            by_role[summary.role_type] += 1
+            by_industry[summary.industry] += 1
+            total_improvement += summary.fit_score_improvement
+
         summary_stats = {
             'successful_summaries_count': len(self.successful_summaries),
-            'summaries_by_role': defaultdict(int),
-            'summaries_by_industry': defaultdict(int),
-            'avg_fit_improvement': 0.0,
-            'most_successful_role': None,
-            'most_successful_industry': None
+            'summaries_by_role': by_role,
+            'summaries_by_industry': by_industry,
+            'avg_fit_improvement': total_improvement / len(self.successful_summaries) if self.successful_summaries else 0.0,
+            'most_successful_role': by_role.most_common(1)[0][0] if by_role else None,
+            'most_successful_industry': by_industry.most_common(1)[0][0] if by_industry else None
         }
 
-        if self.successful_summaries:
-            total_improvement = sum(s.fit_score_improvement for s in self.successful_summaries)
-            summary_stats['avg_fit_improvement'] = total_improvement / len(self.successful_summaries)
-
-            for summary in self.successful_summaries:
-                summary_stats['summaries_by_role'][summary.role_type] += 1
-                summary_stats['summaries_by_industry'][summary.industry] += 1
-
-            summary_stats['most_successful_role'] = max(summary_stats['summaries_by_role'],
-                                                      key=summary_stats['summaries_by_role'].get)
-            summary_stats['most_successful_industry'] = max(summary_stats['summaries_by_industry'],
-                                                           key=summary_stats['summaries_by_industry'].get)
-
         return {**base_stats, **summary_stats}
@@ -3,13 +3,96 @@ Template Selector - Intelligent CV Template Selection from Existing Outputs
 CVPilot - Automatically selects the best CV template from previously generated outputs
 """
 
+import functools
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from typing import List, Dict, Any, FrozenSet, NamedTuple, Tuple, Optional
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 import logging
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# CV files: PedroHerrera_{Role}_{Spec}_{Model}_{Year}.docx
+CV_FILENAME_PATTERN = re.compile(r'PedroHerrera_([A-Z]+)_([A-Z]+)_([A-Z]+)_(\d{4})\.docx')
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_DAY_US = 86_400_000_000
+
+# Job title phrases -> template role codes that match them exactly
+ROLE_TITLE_CODES = (
+    ('product analyst', 'PA'),
+    ('data analyst', 'DA'),
+    ('product manager', 'PM'),
+    ('product owner', 'PO'),
+    ('project manager', 'PJM'),
+    ('business analyst', 'BA'),
+    ('operations manager', 'OM'),
+)
+_ROLE_CODE_BY_PHRASE = dict(ROLE_TITLE_CODES)
+# No phrase can start inside another, so one non-overlapping scan finds them all
+_ROLE_TITLE_PATTERN = re.compile('|'.join(re.escape(phrase) for phrase, _ in ROLE_TITLE_CODES))
+
+# Job title keywords that decide which template specializations fit
+ANALYTICS_TITLE_KEYWORDS = ('analytics', 'data', 'sql', 'tableau', 'python')
+TECHNICAL_TITLE_KEYWORDS = ('code', 'development', 'engineering')
+_ANALYTICS_TITLE_PATTERN = re.compile('|'.join(map(re.escape, ANALYTICS_TITLE_KEYWORDS)))
+_TECHNICAL_TITLE_PATTERN = re.compile('|'.join(map(re.escape, TECHNICAL_TITLE_KEYWORDS)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _title_role_codes(job_lower: str) -> FrozenSet[str]:
+    """Role codes whose phrase appears in a lowercased job title"""
+    return frozenset(_ROLE_CODE_BY_PHRASE[phrase] for phrase in _ROLE_TITLE_PATTERN.findall(job_lower))
+
+
+@functools.lru_cache(maxsize=1024)
+def _title_focus(job_lower: str) -> str:
+    """'analytics', 'technical' or 'general' focus of a lowercased job title"""
+    if _ANALYTICS_TITLE_PATTERN.search(job_lower):
+        return 'analytics'
+    if _TECHNICAL_TITLE_PATTERN.search(job_lower):
+        return 'technical'
+    return 'general'
+
+
+# Set bits per byte value, for popcounts over packed tool bitmaps
+_BYTE_BIT_COUNTS = np.array([bin(value).count('1') for value in range(256)], dtype=np.int64)
+
+
+def _skills_scores(tool_bits: np.ndarray, has_tools: np.ndarray, job_bits: np.ndarray, n_required: int) -> np.ndarray:
+    """Skills/tools overlap score per candidate (see _calculate_tools_overlap)"""
+    scores = np.zeros(tool_bits.shape[0])
+    for i in range(tool_bits.shape[0]):
+        if not has_tools[i]:
+            continue
+        if n_required == 0:
+            scores[i] = 0.5  # Neutral score if no job requirements specified
+            continue
+
+        overlap = 0
+        for byte in range(job_bits.shape[0]):
+            overlap += _BYTE_BIT_COUNTS[tool_bits[i, byte] & job_bits[byte]]
+        overlap_ratio = overlap / n_required
+
+        # Bonus for having multiple matching tools
+        if overlap >= 2:
+            overlap_ratio += 0.2
+
+        scores[i] = min(overlap_ratio, 1.0)
+    return scores
+
+
+if NUMBA_AVAILABLE:
+    _skills_scores = njit(cache=True)(_skills_scores)
 
 @dataclass
 class TemplateCandidate:
@@ -29,6 +112,39 @@ class TemplateCandidate:
         if self.match_reasons is None:
             self.match_reasons = []
 
+class _JobRequirements(NamedTuple):
+    """A job reduced to what the template scorers read"""
+    title: str  # Lowercased
+    tools: FrozenSet[str]  # Lowercased skills + software
+
+class _CandidateArrays:
+    """Scanned candidates as parallel arrays, so find_best_template scores them all at once"""
+
+    def __init__(self, candidates: List[TemplateCandidate]):
+        # Role and specialization scores depend only on the code, so score each distinct code once
+        self.roles, self.role_index = np.unique([c.role for c in candidates], return_inverse=True)
+        self.specs, self.spec_index = np.unique([c.specialization for c in candidates], return_inverse=True)
+
+        # Lowercased tools as one packed bitmap per candidate over the scanned tool vocabulary
+        self.tool_ids: Dict[str, int] = {}
+        rows = [[self.tool_ids.setdefault(tool.lower(), len(self.tool_ids)) for tool in c.tools]
+                for c in candidates]
+        tools = np.zeros((len(candidates), len(self.tool_ids)), dtype=np.uint8)
+        for i, columns in enumerate(rows):
+            tools[i, columns] = 1
+        self.tool_bits = np.packbits(tools, axis=1)
+        self.has_tools = np.array([bool(c.tools) for c in candidates])
+
+        self.has_date = np.array([c.file_date is not None for c in candidates])
+        self.file_us = np.array([(c.file_date - _EPOCH) // _MICROSECOND if c.file_date else 0 for c in candidates],
+                                dtype=np.int64)
+
+    def tools_bitmap(self, tools: set) -> np.ndarray:
+        """Packed bitmap of the given lowercased tools; ones outside the vocabulary can't overlap"""
+        bits = np.zeros(len(self.tool_ids), dtype=np.uint8)
+        bits[[self.tool_ids[tool] for tool in tools if tool in self.tool_ids]] = 1
+        return np.packbits(bits)
+
 class TemplateSelector:
     """Intelligent template selector that finds the best CV match from existing outputs"""
 
@@ -58,6 +174,11 @@ class TemplateSelector:
             'data': ['DATA']
         }
 
+        # Last scan, reused while no folder under output_dir has changed
+        self._scan_cache: Optional[List[TemplateCandidate]] = None
+        self._scan_arrays: Optional[_CandidateArrays] = None
+        self._scan_signature: Optional[Tuple] = None
+
     def find_best_template(self, job_data: Dict[str, Any], profile_type: str) -> Optional[TemplateCandidate]:
         """
         Find the best template for the given job by analyzing existing CVs
@@ -69,25 +190,21 @@ class TemplateSelector:
         Returns:
             Best template candidate or None if no suitable template found
         """
-        candidates = self._scan_existing_templates()
-        if not candidates:
+        if not self._refresh_scan():
             self.logger.info("No existing templates found")
             return None
 
-        # Score each candidate
-        scored_candidates = []
-        for candidate in candidates:
-            score, reasons = self._score_template(candidate, job_data, profile_type)
-            candidate.score = score
-            candidate.match_reasons = reasons
-            scored_candidates.append(candidate)
+        # Normalize the job and read the clock once for every scorer
+        job = self._normalize_job(job_data)
+        now = datetime.now()
 
-        # Sort by score (highest first)
-        scored_candidates.sort(key=lambda x: x.score, reverse=True)
+        # Score every candidate at once; the first highest score wins
+        scores = self._score_all_templates(job, profile_type, now)
+        best_candidate = replace(self._scan_cache[int(np.argmax(scores))])
+        best_candidate.score, best_candidate.match_reasons = self._score_candidate(best_candidate, job,
+                                                                                   profile_type, now)
 
-        best_candidate = scored_candidates[0] if scored_candidates else None
-
-        if best_candidate and best_candidate.score > 0:
+        if best_candidate.score > 0:
             self.logger.info(f"🎯 Best template found: {best_candidate.file_path.name}")
             self.logger.info(f"   Score: {best_candidate.score:.2f}")
             self.logger.info(f"   Reasons: {', '.join(best_candidate.match_reasons)}")
@@ -97,54 +214,89 @@ class TemplateSelector:
             return None
 
     def _scan_existing_templates(self) -> List[TemplateCandidate]:
-        """Scan output directory for existing CV templates"""
-        candidates = []
+        """Existing CV templates, rescanned only when output_dir or one of its folders changed"""
+        if not self._refresh_scan():
+            return []
+
+        # Fresh copies so scoring never leaks between calls
+        return [replace(candidate, score=0.0, match_reasons=[]) for candidate in self._scan_cache]
 
+    def _refresh_scan(self) -> bool:
+        """Rescan output_dir if it changed since the last scan; True if any templates are known"""
         if not self.output_dir.exists():
-            return candidates
-
-        # Pattern to match CV files: PedroHerrera_{Role}_{Spec}_{Model}_{Year}.docx
-        cv_pattern = re.compile(r'PedroHerrera_([A-Z]+)_([A-Z]+)_([A-Z]+)_(\d{4})\.docx$')
-
-        for folder in self.output_dir.iterdir():
-            if not folder.is_dir():
-                continue
-
-            # Skip data_analytics folder (seems to be different structure)
-            if folder.name == 'data_analytics':
-                continue
-
-            for file_path in folder.glob("*.docx"):
-                match = cv_pattern.match(file_path.name)
-                if match:
-                    role_prefix, spec_prefix, model_prefix, year = match.groups()
-
-                    # Parse folder name to extract tools
-                    tools = self._extract_tools_from_folder(folder.name)
-
-                    # Get file modification date
-                    file_date = None
-                    try:
-                        file_date = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    except:
-                        pass
-
-                    candidate = TemplateCandidate(
-                        file_path=file_path,
-                        folder_name=folder.name,
-                        role=role_prefix,
-                        specialization=spec_prefix,
-                        tools=tools,
-                        business_model=model_prefix,
-                        year=year,
-                        file_date=file_date
-                    )
-
-                    candidates.append(candidate)
+            return False
+
+        # Adding or removing a CV updates its folder's mtime, so one stat per folder detects changes
+        try:
+            signature = tuple(sorted((folder.name, folder.stat().st_mtime_ns)
+                                     for folder in self.output_dir.iterdir() if folder.is_dir()))
+        except OSError:
+            signature = None
+
+        if signature is None or signature != self._scan_signature or self._scan_cache is None:
+            self._scan_cache = self._scan_output_folders()
+            self._scan_arrays = _CandidateArrays(self._scan_cache) if self._scan_cache else None
+            self._scan_signature = signature
+
+        return bool(self._scan_cache)
+
+    def _scan_output_folders(self) -> List[TemplateCandidate]:
+        """Scan output directory for existing CV templates"""
+        # Skip data_analytics folder (seems to be different structure)
+        folders = [folder for folder in self.output_dir.iterdir()
+                   if folder.is_dir() and folder.name != 'data_analytics']
+
+        # Scan folders on worker threads (scandir/stat release the GIL), keeping folder order
+        candidates = []
+        if folders:
+            workers = min(8, (os.cpu_count() or 1) * 2, len(folders))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for folder_candidates in pool.map(self._scan_folder, folders):
+                    candidates.extend(folder_candidates)
 
         self.logger.info(f"📁 Found {len(candidates)} existing CV templates")
         return candidates
 
+    def _scan_folder(self, folder: Path) -> List[TemplateCandidate]:
+        """CV templates directly inside one output folder"""
+        candidates = []
+
+        # Parse folder name to extract tools
+        tools = self._extract_tools_from_folder(folder.name)
+
+        # An unreadable or vanished folder is skipped rather than failing the whole scan
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    match = CV_FILENAME_PATTERN.fullmatch(entry.name)
+                    if match:
+                        role_prefix, spec_prefix, model_prefix, year = match.groups()
+
+                        # Get file modification date
+                        file_date = None
+                        try:
+                            file_date = datetime.fromtimestamp(entry.stat().st_mtime)
+                        except:
+                            pass
+
+                        candidate = TemplateCandidate(
+                            file_path=folder / entry.name,
+                            folder_name=folder.name,
+                            role=role_prefix,
+                            specialization=spec_prefix,
+                            tools=list(tools),
+                            business_model=model_prefix,
+                            year=year,
+                            file_date=file_date
+                        )
+
+                        candidates.append(candidate)
+        except OSError as e:
+            self.logger.warning(f"⚠️ Skipping unreadable folder {folder.name}: {e}")
+            return []
+
+        return candidates
+
     def _extract_tools_from_folder(self, folder_name: str) -> List[str]:
         """Extract tools from folder name like 'Product Analyst - General - Python, SQL, Tableau'"""
         parts = folder_name.split(' - ')
@@ -155,18 +307,8 @@ class TemplateSelector:
             return tools
         return []
 
-    def _score_template(self, candidate: TemplateCandidate, job_data: Dict[str, Any],
-                       profile_type: str) -> Tuple[float, List[str]]:
-        """
-        Score a template candidate based on job requirements
-
-        Returns:
-            Tuple of (score, reasons_list)
-        """
-        score = 0.0
-        reasons = []
-
-        # Handle both dict and JobData object formats
+    def _normalize_job(self, job_data: Any) -> _JobRequirements:
+        """Lowercased title and skills + software of a job (dict or JobData object)"""
         if hasattr(job_data, 'job_title_original'):
             # It's a JobData object
             job_title = getattr(job_data, 'job_title_original', '').lower()
@@ -177,6 +319,44 @@ class TemplateSelector:
             job_title = job_data.get('job_title_original', '').lower()
             job_skills = set(job_data.get('skills', []))
             job_software = set(job_data.get('software', []))
+        return _JobRequirements(job_title, frozenset(skill.lower() for skill in job_skills) |
+                                frozenset(soft.lower() for soft in job_software))
+
+    def _score_all_templates(self, job: _JobRequirements, profile_type: str, now: datetime) -> np.ndarray:
+        """_score_candidate's score for every scanned candidate, as one array"""
+        arrays = self._scan_arrays
+        job_title = job.title
+
+        # 1. Role matching (40% weight)
+        role_scores = np.array([self._calculate_role_score(role, job_title, profile_type)
+                                for role in arrays.roles])[arrays.role_index]
+
+        # 2. Skills/Tools matching (35% weight)
+        skills_scores = _skills_scores(arrays.tool_bits, arrays.has_tools, arrays.tools_bitmap(job.tools),
+                                       len(job.tools))
+
+        # 3. Specialization alignment (15% weight)
+        spec_scores = np.array([self._calculate_specialization_score(spec, job_title)
+                                for spec in arrays.specs])[arrays.spec_index]
+
+        # 4. Recency bonus (10% weight), same thresholds as _calculate_recency_score
+        days_old = ((now - _EPOCH) // _MICROSECOND - arrays.file_us) // _DAY_US
+        recency_scores = np.select([days_old <= 7, days_old <= 30, days_old <= 90], [1.0, 0.8, 0.6], 0.3)
+        recency_scores = np.where(arrays.has_date, recency_scores, 0.0)
+
+        return role_scores * 0.4 + skills_scores * 0.35 + spec_scores * 0.15 + recency_scores * 0.1
+
+    def _score_candidate(self, candidate: TemplateCandidate, job: _JobRequirements,
+                         profile_type: str, now: datetime) -> Tuple[float, List[str]]:
+        """
+        Score a template candidate against a normalized job
+
+        Returns:
+            Tuple of (score, reasons_list)
+        """
+        score = 0.0
+        reasons = []
+        job_title = job.title
 
         # 1. Role matching (40% weight)
         role_score = self._calculate_role_score(candidate.role, job_title, profile_type)
@@ -185,7 +365,7 @@ class TemplateSelector:
             reasons.append(f"Role match: {candidate.role}")
 
         # 2. Skills/Tools matching (35% weight)
-        skills_score = self._calculate_skills_score(candidate.tools, job_skills, job_software)
+        skills_score = self._calculate_tools_overlap(candidate.tools, job.tools)
         score += skills_score * 0.35
         if skills_score > 0.5:
             reasons.append(f"Skills match: {', '.join(candidate.tools[:3])}")
@@ -197,7 +377,7 @@ class TemplateSelector:
             reasons.append(f"Specialization: {candidate.specialization}")
 
         # 4. Recency bonus (10% weight) - newer templates get slight preference
-        recency_score = self._calculate_recency_score(candidate.file_date)
+        recency_score = self._calculate_recency_score(candidate.file_date, now)
         score += recency_score * 0.1
         if recency_score > 0.5:
             reasons.append("Recent template")
@@ -209,19 +389,7 @@ class TemplateSelector:
         job_lower = job_title.lower()
 
         # Exact role matching with higher priority
-        if 'product analyst' in job_lower and template_role == 'PA':
-            return 1.0
-        elif 'data analyst' in job_lower and template_role == 'DA':
-            return 1.0
-        elif 'product manager' in job_lower and template_role == 'PM':
-            return 1.0
-        elif 'product owner' in job_lower and template_role == 'PO':
-            return 1.0
-        elif 'project manager' in job_lower and template_role == 'PJM':
-            return 1.0
-        elif 'business analyst' in job_lower and template_role == 'BA':
-            return 1.0
-        elif 'operations manager' in job_lower and template_role == 'OM':
+        if template_role in _title_role_codes(job_lower):
             return 1.0
 
         # Profile type matching (fallback)
@@ -242,23 +410,16 @@ class TemplateSelector:
         # Very low score for completely different roles
         return 0.1
 
-    def _calculate_skills_score(self, template_tools: List[str], job_skills: set, job_software: set) -> float:
-        """Calculate skills/tools overlap score"""
+    def _calculate_tools_overlap(self, template_tools: List[str], job_all: FrozenSet[str]) -> float:
+        """Skills/tools overlap score against the job's lowercased skills + software"""
         if not template_tools:
             return 0.0
 
-        template_tools_lower = set(tool.lower() for tool in template_tools)
-        job_skills_lower = set(skill.lower() for skill in job_skills)
-        job_software_lower = set(soft.lower() for soft in job_software)
-
-        # Combine job requirements
-        job_all = job_skills_lower | job_software_lower
-
         if not job_all:
             return 0.5  # Neutral score if no job requirements specified
 
         # Calculate overlap
-        overlap = template_tools_lower & job_all
+        overlap = {tool.lower() for tool in template_tools} & job_all
         overlap_ratio = len(overlap) / len(job_all)
 
         # Bonus for having multiple matching tools
@@ -269,17 +430,17 @@ class TemplateSelector:
 
     def _calculate_specialization_score(self, template_spec: str, job_title: str) -> float:
         """Calculate specialization alignment score"""
-        job_lower = job_title.lower()
+        focus = _title_focus(job_title.lower())
 
         # Analytics/data focused jobs
-        if any(word in job_lower for word in ['analytics', 'data', 'sql', 'tableau', 'python']):
+        if focus == 'analytics':
             if template_spec in ['ANAL', 'AIML', 'ANDE', 'ANCO']:
                 return 1.0
             elif template_spec == 'GEN':
                 return 0.6
 
         # Technical/development jobs
-        elif any(word in job_lower for word in ['code', 'development', 'engineering']):
+        elif focus == 'technical':
             if template_spec in ['CODE', 'AIML']:
                 return 1.0
             elif template_spec == 'GEN':
@@ -294,12 +455,12 @@ class TemplateSelector:
 
         return 0.0
 
-    def _calculate_recency_score(self, file_date: Optional[datetime]) -> float:
-        """Calculate recency score (newer = higher score)"""
+    def _calculate_recency_score(self, file_date: Optional[datetime], now: Optional[datetime] = None) -> float:
+        """Calculate recency score (newer = higher score), relative to now (default: current time)"""
         if not file_date:
             return 0.0
 
-        days_old = (datetime.now() - file_date).days
+        days_old = ((now or datetime.now()) - file_date).days
 
         if days_old <= 7:  # Very recent
             return 1.0
@@ -317,8 +478,7 @@ class TemplateSelector:
 
         # Parse filename
         filename = template_path.name
-        cv_pattern = re.compile(r'PedroHerrera_([A-Z]+)_([A-Z]+)_([A-Z]+)_(\d{4})\.docx$')
-        match = cv_pattern.match(filename)
+        match = CV_FILENAME_PATTERN.fullmatch(filename)
 
         if match:
             role_prefix, spec_prefix, model_prefix, year = match.groups()
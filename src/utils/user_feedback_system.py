@@ -3,7 +3,6 @@ User Feedback System - Interactive Template Rating and Learning
 CVPilot - Collects explicit user feedback on template selections
 """
 
-import json
 import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -16,8 +15,20 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, FloatPrompt, IntPrompt, Confirm
 
+from .json_io import end_torn_line, json_line, parse_json, read_json, write_json
+
 console = Console()
 
+def _parse_timestamp(timestamp: Any) -> Optional[datetime]:
+    """Naive local datetime for a stored ISO timestamp, or None if it cannot be read"""
+    try:
+        moment = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return moment
+
 @dataclass
 class FeedbackSession:
     """Represents a user feedback session"""
@@ -56,14 +67,25 @@ class UserFeedbackSystem:
     def __init__(self, data_dir: str = "./data/feedback"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self.feedback_file = self.data_dir / "user_ratings.json"
-        self.sessions_file = self.data_dir / "feedback_sessions.json"
+        self.feedback_file = self.data_dir / "user_ratings.jsonl"  # Append-only, one rating per line
+        self.sessions_file = self.data_dir / "feedback_sessions.jsonl"  # Append-only, one session per line
+        self.legacy_feedback_file = self.data_dir / "user_ratings.json"
+        self.legacy_sessions_file = self.data_dir / "feedback_sessions.json"
         self.logger = logging.getLogger(__name__)
 
         # Load existing data
         self.ratings = self._load_ratings()
         self.sessions = self._load_sessions()
 
+        # Prompt state, kept current by _record_session
+        self._rated_job_ids = {s.job_id for s in self.sessions if s.feedback_collected}
+        # Sessions with unreadable timestamps are skipped rather than failing construction
+        self._last_feedback_dt = max(
+            (moment for moment in (_parse_timestamp(s.timestamp) for s in self.sessions if s.feedback_collected)
+             if moment is not None),
+            default=None
+        )
+
         # Feedback collection settings
         self.feedback_prompt_enabled = True
         self.min_sessions_before_prompt = 2
@@ -109,8 +131,8 @@ class UserFeedbackSystem:
 
         if rating:
             self.ratings.append(rating)
+            self._append_record(self.feedback_file, rating)
             self._record_session(job_id, job_title, original_template, selected_template, True)
-            self._save_data()
 
             console.print("\n[green]✅ Thank you for your feedback! It will help improve future selections.[/green]")
 
@@ -185,19 +207,12 @@ class UserFeedbackSystem:
             return True
 
         # Check if already rated this job
-        for session in self.sessions:
-            if session.job_id == job_id and session.feedback_collected:
-                return False
+        if job_id in self._rated_job_ids:
+            return False
 
         # Check time since last feedback
-        last_feedback_time = None
-        for session in sorted(self.sessions, key=lambda x: x.timestamp, reverse=True):
-            if session.feedback_collected:
-                last_feedback_time = datetime.fromisoformat(session.timestamp)
-                break
-
-        if last_feedback_time:
-            days_since = (datetime.now() - last_feedback_time).days
+        if self._last_feedback_dt:
+            days_since = (datetime.now() - self._last_feedback_dt).days
             if days_since < self.days_between_prompts:
                 return False
 
@@ -218,35 +233,41 @@ class UserFeedbackSystem:
         )
 
         self.sessions.append(session)
+        self._append_record(self.sessions_file, session)
+
+        if feedback_collected:
+            self._rated_job_ids.add(job_id)
+            feedback_dt = _parse_timestamp(session.timestamp)
+            if feedback_dt is not None and (self._last_feedback_dt is None or feedback_dt > self._last_feedback_dt):
+                self._last_feedback_dt = feedback_dt
 
     def get_feedback_statistics(self) -> Dict[str, Any]:
         """Get statistics about collected feedback"""
         if not self.ratings:
             return {'total_ratings': 0, 'avg_rating': 0, 'feedback_enabled': self.feedback_prompt_enabled}
 
-        ratings = [r.rating for r in self.ratings]
-        avg_rating = sum(ratings) / len(ratings)
-
-        # Category averages
-        category_avgs = {}
+        # One pass: running totals overall and per category
+        total_rating = 0.0
+        category_sums = {}
+        category_counts = {}
         for rating in self.ratings:
+            total_rating += rating.rating
             for category, score in rating.categories_rated.items():
-                if category not in category_avgs:
-                    category_avgs[category] = []
-                category_avgs[category].append(score)
+                category_sums[category] = category_sums.get(category, 0.0) + score
+                category_counts[category] = category_counts.get(category, 0) + 1
 
-        category_averages = {
-            cat: sum(scores) / len(scores)
-            for cat, scores in category_avgs.items()
-        }
+        feedback_sessions = sum(1 for session in self.sessions if session.feedback_collected)
 
         return {
             'total_ratings': len(self.ratings),
-            'avg_rating': round(avg_rating, 2),
-            'category_averages': {k: round(v, 2) for k, v in category_averages.items()},
+            'avg_rating': round(total_rating / len(self.ratings), 2),
+            'category_averages': {
+                cat: round(total / category_counts[cat], 2)
+                for cat, total in category_sums.items()
+            },
             'feedback_enabled': self.feedback_prompt_enabled,
             'total_sessions': len(self.sessions),
-            'feedback_rate': len([s for s in self.sessions if s.feedback_collected]) / max(len(self.sessions), 1)
+            'feedback_rate': feedback_sessions / max(len(self.sessions), 1)
         }
 
     def show_feedback_summary(self):
@@ -313,41 +334,61 @@ class UserFeedbackSystem:
 
     def _load_ratings(self) -> List[TemplateRating]:
         """Load user ratings from file"""
-        if not self.feedback_file.exists():
-            return []
-
-        try:
-            with open(self.feedback_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [TemplateRating(**item) for item in data]
-        except Exception as e:
-            self.logger.error(f"Error loading ratings: {e}")
-            return []
+        return self._load_records(self.feedback_file, self.legacy_feedback_file, TemplateRating, "ratings")
 
     def _load_sessions(self) -> List[FeedbackSession]:
         """Load feedback sessions from file"""
-        if not self.sessions_file.exists():
+        return self._load_records(self.sessions_file, self.legacy_sessions_file, FeedbackSession, "sessions")
+
+    def _load_records(self, path: Path, legacy_path: Path, record_type: type, label: str) -> list:
+        """Read a JSONL log, converting the old whole-array .json file on first run"""
+        if not path.exists():
+            return self._migrate_legacy_records(path, legacy_path, record_type, label)
+
+        # Decode line by line so one torn or corrupt line only loses that record
+        records = []
+        skipped = 0
+        try:
+            with open(path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(record_type(**parse_json(line)))
+                    except (ValueError, TypeError):
+                        skipped += 1
+            end_torn_line(path)
+        except OSError as e:
+            self.logger.error(f"Error loading {label}: {e}")
+
+        if skipped:
+            self.logger.warning(f"⚠️ Skipped {skipped} unreadable lines in {path.name}")
+        return records
+
+    def _migrate_legacy_records(self, path: Path, legacy_path: Path, record_type: type, label: str) -> list:
+        """Convert an old whole-array .json file into its JSONL log"""
+        if not legacy_path.exists():
             return []
 
         try:
-            with open(self.sessions_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [FeedbackSession(**item) for item in data]
+            records = [record_type(**item) for item in read_json(legacy_path)]
+
+            # Write the whole log before it appears, so a partial migration is retried on the next run
+            tmp_path = path.with_suffix(path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(json_line(asdict(record)) for record in records)
+            tmp_path.replace(path)
+            self.logger.info(f"Migrated {len(records)} {label} to {path.name}")
+            return records
         except Exception as e:
-            self.logger.error(f"Error loading sessions: {e}")
+            self.logger.error(f"Error migrating {label}: {e}")
             return []
 
-    def _save_data(self):
-        """Save all feedback data"""
+    def _append_record(self, path: Path, record: Any):
+        """Append one rating or session to its log"""
         try:
-            # Save ratings
-            with open(self.feedback_file, 'w', encoding='utf-8') as f:
-                json.dump([asdict(rating) for rating in self.ratings], f, indent=2, ensure_ascii=False)
-
-            # Save sessions
-            with open(self.sessions_file, 'w', encoding='utf-8') as f:
-                json.dump([asdict(session) for session in self.sessions], f, indent=2, ensure_ascii=False)
-
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json_line(asdict(record)))
         except Exception as e:
             self.logger.error(f"Error saving feedback data: {e}")
 
@@ -376,7 +417,6 @@ class UserFeedbackSystem:
         }
 
         output_path = Path(output_file)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(output_path, report)
 
         console.print(f"📄 Feedback report exported to {output_path}")
@@ -47,9 +47,8 @@ class UserProfileManager(LoggerMixin):
             return UserProfile()
 
         try:
-            with open(self.profile_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return UserProfile(**data)
+            # Validate straight from the JSON bytes in pydantic-core (the file is user-editable)
+            return UserProfile.model_validate_json(self.profile_file.read_bytes())
         except Exception as e:
             self.logger.error(f"❌ Error loading profile: {e}")
             # Create backup of corrupted file
@@ -79,9 +78,8 @@ class UserProfileManager(LoggerMixin):
                     for old_backup in backups[:-10]:
                         old_backup.unlink()
 
-            # Save current profile
-            with open(self.profile_file, 'w', encoding='utf-8') as f:
-                json.dump(self.profile.dict(), f, indent=2, ensure_ascii=False, default=str)
+            # Save current profile (serialized to JSON directly in pydantic-core)
+            self.profile_file.write_text(self.profile.model_dump_json(indent=2), encoding='utf-8')
 
             self.logger.info("💾 Profile saved successfully")
 
@@ -141,6 +139,7 @@ class UserProfileManager(LoggerMixin):
         """Extract work experience from CV text - Enhanced version"""
         lines = text.split('\n')
         extracted_experience = []
+        now = datetime.now().isoformat()
 
         # Enhanced patterns for job titles and companies
         title_patterns = [
@@ -288,7 +287,7 @@ class UserProfileManager(LoggerMixin):
                             self.logger.info(f"🎯 Added {len(achievements)} achievements for {exp.position}")
 
                         if not existing_exp:
-                            self.profile.add_work_experience(exp)
+                            self.profile.add_work_experience(exp, timestamp=now)
                             extracted_experience.append(exp)
                             self.logger.info(f"💼 Added work experience: {exp.position} at {exp.company} ({exp.start_date} - {exp.end_date or 'Present'})")
                         else:
@@ -327,6 +326,7 @@ class UserProfileManager(LoggerMixin):
                 if keyword.lower() in text.lower():
                     found_skills.add((keyword.title(), category))
 
+        now = datetime.now().isoformat()
         for skill_name, category in found_skills:
             skill = SkillProficiency(
                 name=skill_name,
@@ -334,7 +334,7 @@ class UserProfileManager(LoggerMixin):
                 proficiency_level=3,  # Default proficiency
                 confidence_score=0.7  # Medium confidence from CV extraction
             )
-            self.profile.add_skill(skill)
+            self.profile.add_skill(skill, timestamp=now)
 
         if found_skills:
             self.logger.info(f"🛠️ Added {len(found_skills)} skills from CV")
@@ -385,10 +385,13 @@ class UserProfileManager(LoggerMixin):
                              user_feedback: Optional[str] = None):
         """Learn from user interaction and update profile"""
 
-        # Record the interaction
-        interaction = InteractionHistory(
-            interaction_id=f"int_{int(datetime.now().timestamp())}",
-            timestamp=datetime.now().isoformat(),
+        now = datetime.now()
+        now_iso = now.isoformat()
+
+        # Record the interaction (built from typed values, so validation is skipped)
+        interaction = InteractionHistory.model_construct(
+            interaction_id=f"int_{int(now.timestamp())}",
+            timestamp=now_iso,
             interaction_type="cv_generation",
             job_id=job_data.job_id,
             details={
@@ -403,7 +406,7 @@ class UserProfileManager(LoggerMixin):
             processing_time=result.processing_time
         )
 
-        self.profile.add_interaction(interaction)
+        self.profile.add_interaction(interaction, timestamp=now_iso)
 
         # Update learning metrics
         self.profile.learning_metrics.total_interactions += 1
@@ -418,7 +421,7 @@ class UserProfileManager(LoggerMixin):
 
         # Extract skills from job requirements
         for skill in job_data.skills:
-            existing_skill = next((s for s in self.profile.skills if s.name.lower() == skill.lower()), None)
+            existing_skill = self.profile.get_skill(skill)
             if not existing_skill:
                 new_skill = SkillProficiency(
                     name=skill,
@@ -426,7 +429,7 @@ class UserProfileManager(LoggerMixin):
                     proficiency_level=2,  # Job requirement level
                     confidence_score=0.8
                 )
-                self.profile.add_skill(new_skill)
+                self.profile.add_skill(new_skill, timestamp=now_iso)
 
         # Learn preferred industries
         industry = self._infer_industry_from_job(job_data)
@@ -503,7 +506,7 @@ class UserProfileManager(LoggerMixin):
         industry = self._infer_industry_from_job(job_data)
         if industry:
             relevant_exp = self.profile.get_industry_experience(industry)
-            suggestions["relevant_experience"] = [exp.dict() for exp in relevant_exp[:3]]
+            suggestions["relevant_experience"] = [exp.model_dump() for exp in relevant_exp[:3]]
 
         # Calculate industry alignment
         if industry:
@@ -517,12 +520,12 @@ class UserProfileManager(LoggerMixin):
     def get_profile_summary(self) -> Dict[str, Any]:
         """Get comprehensive profile summary"""
         return {
-            "contact": self.profile.contact.dict(),
+            "contact": self.profile.contact.model_dump(),
             "experience_years": self.profile.calculate_experience_years(),
-            "top_skills": [skill.dict() for skill in self.profile.get_top_skills(10)],
-            "recent_experience": [exp.dict() for exp in self.profile.get_recent_experience(3)],
+            "top_skills": [skill.model_dump() for skill in self.profile.get_top_skills(10)],
+            "recent_experience": [exp.model_dump() for exp in self.profile.get_recent_experience(3)],
             "education_count": len(self.profile.education),
-            "industry_preferences": [pref.dict() for pref in self.profile.industry_preferences],
+            "industry_preferences": [pref.model_dump() for pref in self.profile.industry_preferences],
             "learning_stats": {
                 "total_interactions": len(self.profile.interaction_history),
                 "avg_fit_score": self.profile.learning_metrics.average_fit_score_improvement,
@@ -536,7 +539,7 @@ class UserProfileManager(LoggerMixin):
         """Export complete profile for backup/analysis"""
         export_data = {
             "exported_at": datetime.now().isoformat(),
-            "profile": self.profile.dict(),
+            "profile": self.profile.model_dump(),
             "summary": self.get_profile_summary()
         }
 